@@ -16,5 +16,10 @@ module.exports = {
   coverageDirectory: 'test/coverage',
   coverageReporters: ['text', 'lcov', 'html'],
   setupFilesAfterEnv: ['<rootDir>/test/setup.js'],
+  // Lets JS suites require TypeScript sources such as middleware/security.ts
+  transform: {
+    '\\.ts$': '<rootDir>/test/tsTransform.js',
+    '\\.jsx?$': 'babel-jest'
+  },
 
 };
\ No newline at end of file
@@ -17,12 +17,18 @@ app.use(express.json());
 app.use('/api-docs', swaggerUi.serve, swaggerUi.setup(swaggerJsdoc(swaggerConfig)));
 
 // Auth/RBAC
+const crypto = require('crypto');
 const jwt = require('jsonwebtoken');
+// Resolve the signing key once at startup instead of reading the env on every request
+const SECRET_KEY = process.env.SECRET_KEY
+  ? crypto.createSecretKey(Buffer.from(process.env.SECRET_KEY, 'utf8'))
+  : null;
+const JWT_VERIFY_OPTIONS = Object.freeze({ algorithms: ['HS256'] });
 const authMiddleware = (req, res, next) => {
   const token = req.headers.authorization;
   if (!token) return res.status(401).json({ error: 'Unauthorized' });
   try {
-    const decoded = jwt.verify(token, process.env.SECRET_KEY);
+    const decoded = jwt.verify(token, SECRET_KEY, JWT_VERIFY_OPTIONS);
     req.user = decoded;
     next();
   } catch (err) {
@@ -39,9 +45,24 @@ app.post('/api/v1/trades', authMiddleware, async (req, res) => {
 });
 
 // Risk
-const tf = require('@tensorflow/tfjs');
+// The VaR model is loaded once and shared; concurrent first requests await the same load
+let varModelPromise = null;
+const loadVarModel = () => {
+  if (!varModelPromise) {
+    // TensorFlow.js is large and only this endpoint needs it; require() caches after first use
+    const tf = require('@tensorflow/tfjs');
+    varModelPromise = tf.loadLayersModel('model.json').catch(err => {
+      // Let the next request retry instead of caching the failure
+      varModelPromise = null;
+      throw err;
+    });
+  }
+  return varModelPromise;
+};
+
 app.get('/api/v1/risk/var', authMiddleware, async (req, res) => {
-  const model = await tf.loadLayersModel('model.json');
+  const tf = require('@tensorflow/tfjs');
+  const model = await loadVarModel();
   const varValue = model.predict(tf.tensor([req.body.portfolio])).dataSync()[0];
   res.json({ var: varValue });
 });
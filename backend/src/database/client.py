@@ -24,6 +24,8 @@ class DatabaseClient:
                 min_size=settings.db_min_connections,
                 max_size=settings.db_max_connections,
                 command_timeout=60,
+                statement_cache_size=256,
+                max_inactive_connection_lifetime=300,
                 server_settings={"jit": "off", "application_name": "quantenergx-backend"},
             )
 
@@ -137,11 +137,13 @@ export class KafkaService {
         ],
       });
 
-      this.logger.debug(`Message published to topic ${topic}`, {
-        topic,
-        messageType: message.value.type,
-        timestamp: message.timestamp,
-      });
+      if (this.logger.isDebugEnabled()) {
+        this.logger.debug(`Message published to topic ${topic}`, {
+          topic,
+          messageType: message.value.type,
+          timestamp: message.timestamp,
+        });
+      }
     } catch (error) {
       this.logger.error(`Failed to publish message to topic ${topic}:`, error);
       throw error;
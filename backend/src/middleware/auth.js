@@ -1,5 +1,51 @@
+const crypto = require('crypto');
 const jwt = require('jsonwebtoken');
 
+// Build the HMAC key once; a string secret is re-wrapped into a key object on every verify
+const JWT_KEY = crypto.createSecretKey(
+  Buffer.from(process.env.JWT_SECRET || 'fallback-secret-key', 'utf8')
+);
+const JWT_VERIFY_OPTIONS = Object.freeze({ algorithms: ['HS256'] });
+
+// Short-lived cache of verified token payloads, keyed by token digest so raw tokens
+// are not kept resident. Entries never outlive the token's own exp claim.
+const VERIFIED_TOKEN_TTL_MS = 5000;
+const VERIFIED_TOKEN_CACHE_SIZE = 4096;
+const verifiedTokens = new Map();
+
+const tokenCacheKey = token => crypto.createHash('sha256').update(token).digest('base64');
+
+const getVerifiedToken = key => {
+  const entry = verifiedTokens.get(key);
+  if (!entry) return null;
+
+  if (entry.expiresAt <= Date.now()) {
+    verifiedTokens.delete(key);
+    return null;
+  }
+
+  return entry.payload;
+};
+
+const rememberVerifiedToken = (key, payload) => {
+  const now = Date.now();
+  const tokenExpiresAt = payload.exp ? payload.exp * 1000 : Infinity;
+
+  if (verifiedTokens.size >= VERIFIED_TOKEN_CACHE_SIZE) {
+    // Map iterates in insertion order, so the first key is the oldest entry
+    verifiedTokens.delete(verifiedTokens.keys().next().value);
+  }
+
+  verifiedTokens.set(key, {
+    payload,
+    expiresAt: Math.min(now + VERIFIED_TOKEN_TTL_MS, tokenExpiresAt),
+  });
+};
+
+const clearVerifiedTokens = () => {
+  verifiedTokens.clear();
+};
+
 const authenticateToken = (req, res, next) => {
   const authHeader = req.headers['authorization'];
   const token = authHeader && authHeader.split(' ')[1]; // Bearer TOKEN
@@ -8,14 +54,24 @@ const authenticateToken = (req, res, next) => {
     return res.status(401).json({ error: 'Access token required' });
   }
 
-  jwt.verify(token, process.env.JWT_SECRET || 'fallback-secret-key', (err, user) => {
+  const cacheKey = tokenCacheKey(token);
+  const cached = getVerifiedToken(cacheKey);
+  if (cached) {
+    req.user = cached;
+    return next();
+  }
+
+  jwt.verify(token, JWT_KEY, JWT_VERIFY_OPTIONS, (err, user) => {
     if (err) {
       return res.status(403).json({ error: 'Invalid or expired token' });
     }
 
-    req.user = user;
+    // Frozen so the cached payload can be shared across requests without copying
+    const principal = Object.freeze(user);
+    rememberVerifiedToken(cacheKey, principal);
+    req.user = principal;
     next();
   });
 };
 
-module.exports = { authenticateToken };
+module.exports = { authenticateToken, clearVerifiedTokens };
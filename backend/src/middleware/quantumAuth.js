@@ -4,6 +4,9 @@
  * @author QuantEnergx Team
  */
 
+const crypto = require('crypto');
+const http = require('http');
+const https = require('https');
 const jwt = require('jsonwebtoken');
 const { ethers } = require('ethers');
 const logger = require('winston');
@@ -25,6 +28,12 @@ class QuantumAuthMiddleware {
             ...config
         };
 
+        // Build the HMAC key once instead of re-wrapping the secret string on every verify
+        this.jwtKey = this.config.jwtSecret
+            ? crypto.createSecretKey(Buffer.from(this.config.jwtSecret, 'utf8'))
+            : null;
+        this.jwtVerifyOptions = Object.freeze({ algorithms: ['HS256'] });
+
         // Initialize blockchain provider
         this.provider = new ethers.JsonRpcProvider(this.config.providerUrl);
         
@@ -34,6 +43,17 @@ class QuantumAuthMiddleware {
         // Cache for quantum keys
         this.quantumKeyCache = new Map();
         this.cacheExpiry = 5 * 60 * 1000; // 5 minutes cache
+
+        // Shared keep-alive agents so quantum service calls reuse connections
+        this.quantumRequestOptions = Object.freeze({
+            timeout: 5000,
+            httpAgent: new http.Agent({ keepAlive: true, maxSockets: 32 }),
+            httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 32 })
+        });
+
+        // Cached quantum service availability, refreshed at most once per TTL
+        this.quantumAvailability = null;
+        this.quantumAvailabilityTtl = 60 * 1000; // 1 minute
         
         logger.info('QuantumAuthMiddleware initialized', {
             quantumServiceUrl: this.config.quantumServiceUrl,
@@ -91,7 +111,7 @@ class QuantumAuthMiddleware {
 
                 // Verify JWT token first
                 const token = authHeader.split(' ')[1];
-                const decoded = jwt.verify(token, this.config.jwtSecret);
+                const decoded = jwt.verify(token, this.jwtKey, this.jwtVerifyOptions);
                 
                 if (!decoded.address) {
                     return res.status(401).json({
@@ -304,11 +324,13 @@ class QuantumAuthMiddleware {
      */
     async generateQuantumEntropy() {
         try {
-            const response = await axios.get(`${this.config.quantumServiceUrl}/health`);
-            
-            if (response.data.quantum_available) {
+            if (await this.isQuantumServiceAvailable()) {
                 // If quantum service is available, use it for entropy
-                const entropyResponse = await axios.post(`${this.config.quantumServiceUrl}/generate-entropy`);
+                const entropyResponse = await axios.post(
+                    `${this.config.quantumServiceUrl}/generate-entropy`,
+                    undefined,
+                    this.quantumRequestOptions
+                );
                 return entropyResponse.data.entropy;
             } else {
                 // Fallback to pseudo-random entropy
@@ -324,6 +346,24 @@ class QuantumAuthMiddleware {
         }
     }
 
+    /**
+     * Check quantum service health, reusing the last result until it goes stale
+     */
+    async isQuantumServiceAvailable() {
+        const now = Date.now();
+        if (this.quantumAvailability && this.quantumAvailability.expiresAt > now) {
+            return this.quantumAvailability.available;
+        }
+
+        const response = await axios.get(
+            `${this.config.quantumServiceUrl}/health`,
+            this.quantumRequestOptions
+        );
+        const available = Boolean(response.data.quantum_available);
+        this.quantumAvailability = { available, expiresAt: now + this.quantumAvailabilityTtl };
+        return available;
+    }
+
     /**
      * Validate quantum parameters for a request
      */
@@ -21,8 +21,25 @@ interface SecurityConfig {
   cspDirectives?: Record<string, string[]>;
 }
 
+// Regions with dedicated compliance headers, built once for O(1) lookups per request
+const TRADING_REGIONS: ReadonlySet<string> = new Set(['us', 'eu', 'me', 'guyana', 'bahrain']);
+
+// Restrict access to powerful browser APIs for security
+const PERMISSIONS_POLICY = [
+  'camera=()',
+  'microphone=()',
+  'geolocation=()',
+  'payment=()',
+  'usb=()',
+  'bluetooth=()',
+  'magnetometer=()',
+  'gyroscope=()',
+  'accelerometer=()'
+].join(', ');
+
 export class SecurityMiddleware {
   private config: SecurityConfig;
+  private responseHeaders: ReadonlyArray<readonly [string, string]>;
 
   constructor(config: SecurityConfig = {}) {
     this.config = {
@@ -46,6 +63,65 @@ export class SecurityMiddleware {
       },
       ...config
     };
+
+    // Header values depend only on the config, so resolve the full list once
+    this.responseHeaders = this.buildResponseHeaders();
+  }
+
+  private buildResponseHeaders(): ReadonlyArray<readonly [string, string]> {
+    const headers: Array<readonly [string, string]> = [];
+
+    // HTTP Strict Transport Security (HSTS)
+    if (this.config.enforceHttps) {
+      headers.push(['Strict-Transport-Security', this.buildHstsHeader()]);
+    }
+
+    headers.push(
+      // Content Security Policy (CSP) - Strict policy for trading platform
+      ['Content-Security-Policy', this.buildCspHeader()],
+      // X-Frame-Options - Prevent clickjacking attacks
+      ['X-Frame-Options', 'DENY'],
+      // X-Content-Type-Options - Prevent MIME sniffing
+      ['X-Content-Type-Options', 'nosniff'],
+      // X-XSS-Protection - Legacy XSS protection
+      ['X-XSS-Protection', '1; mode=block'],
+      // Referrer Policy - Control referrer information
+      ['Referrer-Policy', 'strict-origin-when-cross-origin'],
+      // Permissions Policy (formerly Feature Policy)
+      ['Permissions-Policy', PERMISSIONS_POLICY],
+      // X-Permitted-Cross-Domain-Policies - Restrict cross-domain access
+      ['X-Permitted-Cross-Domain-Policies', 'none'],
+      // Cross-Origin-Embedder-Policy - Isolate browsing context
+      ['Cross-Origin-Embedder-Policy', 'require-corp'],
+      // Cross-Origin-Opener-Policy - Isolate browsing context
+      ['Cross-Origin-Opener-Policy', 'same-origin'],
+      // Cross-Origin-Resource-Policy - Control cross-origin resource access
+      ['Cross-Origin-Resource-Policy', 'same-origin']
+    );
+
+    return Object.freeze(headers);
+  }
+
+  private buildHstsHeader(): string {
+    let hstsValue = `max-age=${this.config.hstsMaxAge}`;
+    if (this.config.includeSubDomains) {
+      hstsValue += '; includeSubDomains';
+    }
+    if (this.config.preload) {
+      hstsValue += '; preload';
+    }
+    return hstsValue;
+  }
+
+  private buildCspHeader(): string {
+    return Object.entries(this.config.cspDirectives || {})
+      .map(([directive, sources]) => {
+        if (sources.length === 0) {
+          return directive; // For directives like upgrade-insecure-requests
+        }
+        return `${directive} ${sources.join(' ')}`;
+      })
+      .join('; ');
   }
 
   /**
@@ -53,6 +129,17 @@ export class SecurityMiddleware {
    * Redirects HTTP traffic to HTTPS for secure trading operations
    */
   public enforceHttps = (req: Request, res: Response, next: NextFunction): void => {
+    if (this.redirectIfInsecure(req, res)) {
+      return;
+    }
+    next();
+  };
+
+  /**
+   * Redirect to HTTPS when enforcement is on and the request arrived over plain HTTP
+   * @returns true when a redirect was sent
+   */
+  private redirectIfInsecure(req: Request, res: Response): boolean {
     if (this.config.enforceHttps) {
       // Check various headers that indicate HTTPS/TLS termination
       const isSecure = req.secure || 
@@ -61,79 +148,26 @@ export class SecurityMiddleware {
                       req.get('x-url-scheme') === 'https';
 
       if (!isSecure) {
-        return res.redirect(301, `https://${req.get('host')}${req.url}`);
+        res.redirect(301, `https://${req.get('host')}${req.url}`);
+        return true;
       }
     }
-    next();
-  };
+    return false;
+  }
 
   /**
    * Comprehensive security headers middleware
    * Sets all required security headers for financial trading compliance
    */
   public setSecurityHeaders = (req: Request, res: Response, next: NextFunction): void => {
-    // HTTP Strict Transport Security (HSTS)
-    if (this.config.enforceHttps) {
-      let hstsValue = `max-age=${this.config.hstsMaxAge}`;
-      if (this.config.includeSubDomains) {
-        hstsValue += '; includeSubDomains';
-      }
-      if (this.config.preload) {
-        hstsValue += '; preload';
-      }
-      res.setHeader('Strict-Transport-Security', hstsValue);
-    }
-
-    // Content Security Policy (CSP) - Strict policy for trading platform
-    const cspDirectives = Object.entries(this.config.cspDirectives || {})
-      .map(([directive, sources]) => {
-        if (sources.length === 0) {
-          return directive; // For directives like upgrade-insecure-requests
-        }
-        return `${directive} ${sources.join(' ')}`;
-      })
-      .join('; ');
-    
-    res.setHeader('Content-Security-Policy', cspDirectives);
-
-    // X-Frame-Options - Prevent clickjacking attacks
-    res.setHeader('X-Frame-Options', 'DENY');
-
-    // X-Content-Type-Options - Prevent MIME sniffing
-    res.setHeader('X-Content-Type-Options', 'nosniff');
-
-    // X-XSS-Protection - Legacy XSS protection
-    res.setHeader('X-XSS-Protection', '1; mode=block');
-
-    // Referrer Policy - Control referrer information
-    res.setHeader('Referrer-Policy', 'strict-origin-when-cross-origin');
-
-    // Permissions Policy (formerly Feature Policy)
-    // Restrict access to powerful browser APIs for security
-    const permissionsPolicy = [
-      'camera=()',
-      'microphone=()',
-      'geolocation=()',
-      'payment=()',
-      'usb=()',
-      'bluetooth=()',
-      'magnetometer=()',
-      'gyroscope=()',
-      'accelerometer=()'
-    ].join(', ');
-    res.setHeader('Permissions-Policy', permissionsPolicy);
-
-    // X-Permitted-Cross-Domain-Policies - Restrict cross-domain access
-    res.setHeader('X-Permitted-Cross-Domain-Policies', 'none');
-
-    // Cross-Origin-Embedder-Policy - Isolate browsing context
-    res.setHeader('Cross-Origin-Embedder-Policy', 'require-corp');
-
-    // Cross-Origin-Opener-Policy - Isolate browsing context
-    res.setHeader('Cross-Origin-Opener-Policy', 'same-origin');
+    this.applySecurityHeaders(req, res);
+    next();
+  };
 
-    // Cross-Origin-Resource-Policy - Control cross-origin resource access
-    res.setHeader('Cross-Origin-Resource-Policy', 'same-origin');
+  private applySecurityHeaders(req: Request, res: Response): void {
+    for (const [name, value] of this.responseHeaders) {
+      res.setHeader(name, value);
+    }
 
     // Cache-Control for sensitive trading data
     if (req.path.includes('/api/')) {
@@ -141,15 +175,18 @@ export class SecurityMiddleware {
       res.setHeader('Pragma', 'no-cache');
       res.setHeader('Expires', '0');
     }
-
-    next();
-  };
+  }
 
   /**
    * Regional compliance middleware
    * Adds specific headers based on regional trading requirements
    */
   public setRegionalHeaders = (req: Request, res: Response, next: NextFunction): void => {
+    this.applyRegionalHeaders(req, res);
+    next();
+  };
+
+  private applyRegionalHeaders(req: Request, res: Response): void {
     // Extract region from request (could be from subdomain, header, or path)
     const region = this.getRegionFromRequest(req);
 
@@ -183,7 +220,18 @@ export class SecurityMiddleware {
 
     // Add region identifier for logging and monitoring
     res.setHeader('X-Trading-Region', region || 'global');
-    
+  }
+
+  /**
+   * Combined middleware: HTTPS enforcement, security headers and regional headers
+   * in a single Express layer instead of three stacked ones
+   */
+  public handle = (req: Request, res: Response, next: NextFunction): void => {
+    if (this.redirectIfInsecure(req, res)) {
+      return;
+    }
+    this.applySecurityHeaders(req, res);
+    this.applyRegionalHeaders(req, res);
     next();
   };
 
@@ -196,19 +244,19 @@ export class SecurityMiddleware {
     const host = req.get('host') || '';
     const subdomain = host.split('.')[0];
     
-    if (['us', 'eu', 'me', 'guyana', 'bahrain'].includes(subdomain)) {
+    if (TRADING_REGIONS.has(subdomain)) {
       return subdomain;
     }
 
     // Check custom header
     const regionHeader = req.get('X-Trading-Region');
-    if (regionHeader && ['us', 'eu', 'me', 'guyana', 'bahrain'].includes(regionHeader)) {
+    if (regionHeader && TRADING_REGIONS.has(regionHeader)) {
       return regionHeader;
     }
 
     // Check path prefix
     const pathRegion = req.path.match(/^\/api\/v1\/regions\/([a-z]+)\//);
-    if (pathRegion && ['us', 'eu', 'me', 'guyana', 'bahrain'].includes(pathRegion[1])) {
+    if (pathRegion && TRADING_REGIONS.has(pathRegion[1])) {
       return pathRegion[1];
     }
 
@@ -219,11 +267,7 @@ export class SecurityMiddleware {
    * Get all middleware functions for easy integration
    */
   public getMiddleware() {
-    return [
-      this.enforceHttps,
-      this.setSecurityHeaders,
-      this.setRegionalHeaders
-    ];
+    return [this.handle];
   }
 }
 
@@ -433,7 +433,8 @@ class EnhancedPluginManager extends EventEmitter {
 
   // Private helper methods
   private validatePermissions(required: string[], available: string[]): boolean {
-    return required.every(permission => available.includes(permission));
+    const granted = new Set(available);
+    return required.every(permission => granted.has(permission));
   }
 
   private calculateAverageMarketplaceRating(): number {
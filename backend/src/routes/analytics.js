@@ -1,9 +1,47 @@
 const express = require('express');
 const { query, validationResult } = require('express-validator');
 const { authenticateToken } = require('../middleware/auth');
+const responseCache = require('../utils/responseCache');
 
 const router = express.Router();
 
+// Allowed query values, shared by the validators below
+const PERIODS = Object.freeze(['1D', '7D', '30D', '90D', '1Y']);
+const POSITION_GROUPINGS = Object.freeze(['commodity', 'date', 'region']);
+const RISK_TYPES = Object.freeze(['var', 'exposure', 'concentration', 'correlation']);
+const COMPLIANCE_REGIONS = Object.freeze(['US', 'EU', 'UK', 'ME']);
+const MARKET_TIMEFRAMES = Object.freeze(['1H', '1D', '1W', '1M']);
+const REPORT_FORMATS = Object.freeze(['json', 'csv', 'pdf']);
+
+// Days of history per period; anything not listed (1Y, 12M) spans a year
+const PERIOD_DAYS = Object.freeze({ '1D': 1, '7D': 7, '30D': 30, '90D': 90 });
+
+const BASE_PRICES = Object.freeze({
+  crude_oil: 80.5,
+  natural_gas: 3.2,
+  heating_oil: 2.45,
+  gasoline: 2.3,
+  renewable_certificates: 45.0,
+  carbon_credits: 85.0,
+});
+
+const MIME_TYPES = Object.freeze({
+  csv: 'text/csv',
+  pdf: 'application/pdf',
+  json: 'application/json',
+});
+
+// Per-user analytics responses are reused for this many seconds; trading writes
+// invalidate a user's entries early (see routes/trading.js)
+const ANALYTICS_CACHE_TTL_SECONDS = 60;
+
+async function cachedAnalytics(name, userId, params, compute) {
+  // Keys carry the user's generation, so a trading write orphans all of them with one bump
+  const generation = await responseCache.getGeneration(`analytics:gen:${userId}`);
+  const key = `analytics:${userId}:${generation}:${name}:${JSON.stringify(params)}`;
+  return responseCache.wrap(key, ANALYTICS_CACHE_TTL_SECONDS, compute);
+}
+
 // Analytics service status
 router.get('/', (req, res) => {
   res.json({
@@ -30,7 +68,7 @@ router.get(
   '/dashboard',
   authenticateToken,
   [
-    query('period').optional().isIn(['1D', '7D', '30D', '90D', '1Y']).withMessage('Invalid period'),
+    query('period').optional().isIn(PERIODS).withMessage('Invalid period'),
     query('portfolioId').optional().isString().withMessage('Portfolio ID must be string'),
   ],
   async (req, res) => {
@@ -47,7 +85,9 @@ router.get(
       const userId = req.user.id;
 
       // Generate comprehensive dashboard analytics
-      const dashboard = await generateDashboardAnalytics(userId, portfolioId, period);
+      const dashboard = await cachedAnalytics('dashboard', userId, { portfolioId, period }, () =>
+        generateDashboardAnalytics(userId, portfolioId, period)
+      );
 
       res.json({
         success: true,
@@ -70,7 +110,7 @@ router.get(
   '/trading',
   authenticateToken,
   [
-    query('period').optional().isIn(['1D', '7D', '30D', '90D', '1Y']).withMessage('Invalid period'),
+    query('period').optional().isIn(PERIODS).withMessage('Invalid period'),
     query('commodity').optional().isString().withMessage('Commodity must be string'),
   ],
   async (req, res) => {
@@ -86,7 +126,9 @@ router.get(
       const { period = '30D', commodity } = req.query;
       const userId = req.user.id;
 
-      const analytics = await generateTradingAnalytics(userId, period, commodity);
+      const analytics = await cachedAnalytics('trading', userId, { period, commodity }, () =>
+        generateTradingAnalytics(userId, period, commodity)
+      );
 
       res.json({
         success: true,
@@ -109,10 +151,7 @@ router.get(
   '/positions',
   authenticateToken,
   [
-    query('groupBy')
-      .optional()
-      .isIn(['commodity', 'date', 'region'])
-      .withMessage('Invalid groupBy'),
+    query('groupBy').optional().isIn(POSITION_GROUPINGS).withMessage('Invalid groupBy'),
     query('includeHistorical')
       .optional()
       .isBoolean()
@@ -131,7 +170,12 @@ router.get(
       const { groupBy = 'commodity', includeHistorical = false } = req.query;
       const userId = req.user.id;
 
-      const analytics = await generatePositionAnalytics(userId, groupBy, includeHistorical);
+      const analytics = await cachedAnalytics(
+        'positions',
+        userId,
+        { groupBy, includeHistorical },
+        () => generatePositionAnalytics(userId, groupBy, includeHistorical)
+      );
 
       res.json({
         success: true,
@@ -154,10 +198,7 @@ router.get(
   '/risk',
   authenticateToken,
   [
-    query('riskType')
-      .optional()
-      .isIn(['var', 'exposure', 'concentration', 'correlation'])
-      .withMessage('Invalid risk type'),
+    query('riskType').optional().isIn(RISK_TYPES).withMessage('Invalid risk type'),
     query('confidence')
       .optional()
       .isFloat({ min: 0.8, max: 0.99 })
@@ -176,7 +217,9 @@ router.get(
       const { riskType = 'var', confidence = 0.95 } = req.query;
       const userId = req.user.id;
 
-      const analytics = await generateRiskAnalytics(userId, riskType, confidence);
+      const analytics = await cachedAnalytics('risk', userId, { riskType, confidence }, () =>
+        generateRiskAnalytics(userId, riskType, confidence)
+      );
 
       res.json({
         success: true,
@@ -199,7 +242,7 @@ router.get(
   '/compliance',
   authenticateToken,
   [
-    query('region').optional().isIn(['US', 'EU', 'UK', 'ME']).withMessage('Invalid region'),
+    query('region').optional().isIn(COMPLIANCE_REGIONS).withMessage('Invalid region'),
     query('regulation').optional().isString().withMessage('Regulation must be string'),
   ],
   async (req, res) => {
@@ -215,7 +258,9 @@ router.get(
       const { region, regulation } = req.query;
       const userId = req.user.id;
 
-      const analytics = await generateComplianceAnalytics(userId, region, regulation);
+      const analytics = await cachedAnalytics('compliance', userId, { region, regulation }, () =>
+        generateComplianceAnalytics(userId, region, regulation)
+      );
 
       res.json({
         success: true,
@@ -241,7 +286,7 @@ router.get(
       .optional()
       .isString()
       .withMessage('Commodities must be comma-separated string'),
-    query('timeframe').optional().isIn(['1H', '1D', '1W', '1M']).withMessage('Invalid timeframe'),
+    query('timeframe').optional().isIn(MARKET_TIMEFRAMES).withMessage('Invalid timeframe'),
   ],
   async (req, res) => {
     try {
@@ -256,7 +301,10 @@ router.get(
       const { commodities = 'crude_oil,natural_gas', timeframe = '1D' } = req.query;
       const commodityList = commodities.split(',');
 
-      const analytics = await generateMarketAnalytics(commodityList, timeframe);
+      // Market analytics are not user-specific, so every caller shares one cache entry
+      const analytics = await cachedAnalytics('market', 'shared', { commodities, timeframe }, () =>
+        generateMarketAnalytics(commodityList, timeframe)
+      );
 
       res.json({
         success: true,
@@ -279,7 +327,7 @@ router.get(
   '/reports/trading',
   authenticateToken,
   [
-    query('format').optional().isIn(['json', 'csv', 'pdf']).withMessage('Invalid format'),
+    query('format').optional().isIn(REPORT_FORMATS).withMessage('Invalid format'),
     query('startDate').optional().isISO8601().withMessage('Invalid start date'),
     query('endDate').optional().isISO8601().withMessage('Invalid end date'),
   ],
@@ -295,10 +343,11 @@ router.get(
 
       const { format = 'json', startDate, endDate } = req.query;
       const userId = req.user.id;
+      const now = Date.now();
 
       const dateRange = {
-        start: startDate || new Date(Date.now() - 30 * 24 * 60 * 60 * 1000).toISOString(),
-        end: endDate || new Date().toISOString(),
+        start: startDate || new Date(now - 30 * 24 * 60 * 60 * 1000).toISOString(),
+        end: endDate || new Date(now).toISOString(),
       };
 
       const report = await generateTradingReport(userId, dateRange, format);
@@ -314,7 +363,7 @@ router.get(
         // For CSV/PDF, set appropriate headers and send file
         res.setHeader(
           'Content-Disposition',
-          `attachment; filename=trading-report-${Date.now()}.${format}`
+          `attachment; filename=trading-report-${now}.${format}`
         );
         res.setHeader('Content-Type', getMimeType(format));
         res.send(report);
@@ -334,7 +383,7 @@ router.get(
   '/reports/positions',
   authenticateToken,
   [
-    query('format').optional().isIn(['json', 'csv', 'pdf']).withMessage('Invalid format'),
+    query('format').optional().isIn(REPORT_FORMATS).withMessage('Invalid format'),
     query('asOfDate').optional().isISO8601().withMessage('Invalid as of date'),
   ],
   async (req, res) => {
@@ -349,7 +398,8 @@ router.get(
 
       const { format = 'json', asOfDate } = req.query;
       const userId = req.user.id;
-      const reportDate = asOfDate || new Date().toISOString();
+      const now = new Date();
+      const reportDate = asOfDate || now.toISOString();
 
       const report = await generatePositionsReport(userId, reportDate, format);
 
@@ -363,7 +413,7 @@ router.get(
       } else {
         res.setHeader(
           'Content-Disposition',
-          `attachment; filename=positions-report-${Date.now()}.${format}`
+          `attachment; filename=positions-report-${now.getTime()}.${format}`
         );
         res.setHeader('Content-Type', getMimeType(format));
         res.send(report);
@@ -658,9 +708,10 @@ async function generateMarketAnalytics(commodities, _timeframe) {
 }
 
 async function generateTradingReport(userId, dateRange, format) {
+  const now = Date.now();
   const reportData = {
     reportInfo: {
-      generatedAt: new Date().toISOString(),
+      generatedAt: new Date(now).toISOString(),
       period: dateRange,
       userId,
       format,
@@ -674,7 +725,7 @@ async function generateTradingReport(userId, dateRange, format) {
     },
     tradeDetails: Array.from({ length: 50 }, (_, i) => ({
       tradeId: `T${String(i + 1).padStart(6, '0')}`,
-      timestamp: new Date(Date.now() - Math.random() * 30 * 24 * 60 * 60 * 1000).toISOString(),
+      timestamp: new Date(now - Math.random() * 30 * 24 * 60 * 60 * 1000).toISOString(),
       commodity: ['crude_oil', 'natural_gas', 'gasoline'][Math.floor(Math.random() * 3)],
       side: Math.random() > 0.5 ? 'buy' : 'sell',
       quantity: Math.floor(Math.random() * 10000) + 1000,
@@ -750,12 +801,12 @@ async function generatePositionsReport(userId, asOfDate, format) {
 
 // Utility functions
 function generateMockTimeSeries(type, period) {
-  const days =
-    period === '1D' ? 1 : period === '7D' ? 7 : period === '30D' ? 30 : period === '90D' ? 90 : 365;
+  const days = PERIOD_DAYS[period] || 365;
   const data = [];
+  const now = Date.now();
 
   for (let i = days; i >= 0; i--) {
-    const date = new Date();
+    const date = new Date(now);
     date.setDate(date.getDate() - i);
 
     let value;
@@ -787,15 +838,7 @@ function generateMockTimeSeries(type, period) {
 }
 
 function getBasePrice(commodity) {
-  const basePrices = {
-    crude_oil: 80.5,
-    natural_gas: 3.2,
-    heating_oil: 2.45,
-    gasoline: 2.3,
-    renewable_certificates: 45.0,
-    carbon_credits: 85.0,
-  };
-  return basePrices[commodity] || 50.0;
+  return BASE_PRICES[commodity] || 50.0;
 }
 
 function generateCorrelationMatrix(commodities) {
@@ -814,12 +857,7 @@ function generateCorrelationMatrix(commodities) {
 }
 
 function getMimeType(format) {
-  const mimeTypes = {
-    csv: 'text/csv',
-    pdf: 'application/pdf',
-    json: 'application/json',
-  };
-  return mimeTypes[format] || 'application/octet-stream';
+  return MIME_TYPES[format] || 'application/octet-stream';
 }
 
 function convertToCSV(data) {
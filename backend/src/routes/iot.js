@@ -8,6 +8,7 @@ const router = express.Router();
 const IoTSmartMeterService = require('../services/iotSmartMeterService');
 
 const iotService = new IoTSmartMeterService();
+const MINUTE_MS = 60 * 1000;
 
 /**
  * @route   POST /api/v1/iot/devices/register
@@ -217,13 +218,14 @@ router.get('/protocols', (req, res) => {
 router.get('/devices', async (req, res) => {
   try {
     // Mock device list - in real implementation, query database
+    const now = Date.now();
     const devices = [
       {
         id: 'SMART_METER_ABC_1705123456789',
         name: 'Building A Main Meter',
         type: 'smart_meter',
         status: 'active',
-        last_seen: new Date(Date.now() - 5 * 60 * 1000).toISOString(),
+        last_seen: new Date(now - 5 * MINUTE_MS).toISOString(),
         location: 'New York, NY',
       },
       {
@@ -231,7 +233,7 @@ router.get('/devices', async (req, res) => {
         name: 'Rooftop Solar Inverter 1',
         type: 'solar_inverter',
         status: 'active',
-        last_seen: new Date(Date.now() - 2 * 60 * 1000).toISOString(),
+        last_seen: new Date(now - 2 * MINUTE_MS).toISOString(),
         location: 'California, CA',
       },
       {
@@ -239,7 +241,7 @@ router.get('/devices', async (req, res) => {
         name: 'Wind Farm Turbine 01',
         type: 'wind_turbine',
         status: 'active',
-        last_seen: new Date(Date.now() - 1 * 60 * 1000).toISOString(),
+        last_seen: new Date(now - MINUTE_MS).toISOString(),
         location: 'Texas, TX',
       },
     ];
@@ -250,17 +252,22 @@ router.get('/devices', async (req, res) => {
       location: req.query.location,
     };
 
-    let filteredDevices = devices;
-    if (filters.type) {
-      filteredDevices = filteredDevices.filter(d => d.type === filters.type);
-    }
-    if (filters.status) {
-      filteredDevices = filteredDevices.filter(d => d.status === filters.status);
-    }
-    if (filters.location) {
-      filteredDevices = filteredDevices.filter(d =>
-        d.location.toLowerCase().includes(filters.location.toLowerCase())
-      );
+    const locationFilter = filters.location && filters.location.toLowerCase();
+    const filteredDevices = devices.filter(
+      d =>
+        (!filters.type || d.type === filters.type) &&
+        (!filters.status || d.status === filters.status) &&
+        (!locationFilter || d.location.toLowerCase().includes(locationFilter))
+    );
+
+    // Build the summary in a single pass over the filtered list
+    let activeDevices = 0;
+    const deviceTypes = new Set();
+    const locations = new Set();
+    for (const device of filteredDevices) {
+      if (device.status === 'active') activeDevices++;
+      deviceTypes.add(device.type);
+      locations.add(device.location);
     }
 
     res.json({
@@ -268,9 +275,9 @@ router.get('/devices', async (req, res) => {
       total_devices: filteredDevices.length,
       devices: filteredDevices,
       device_summary: {
-        active_devices: filteredDevices.filter(d => d.status === 'active').length,
-        device_types: [...new Set(filteredDevices.map(d => d.type))],
-        locations: [...new Set(filteredDevices.map(d => d.location))],
+        active_devices: activeDevices,
+        device_types: [...deviceTypes],
+        locations: [...locations],
       },
     });
   } catch (error) {
@@ -291,17 +298,19 @@ router.get('/devices/:deviceId/status', async (req, res) => {
     const { deviceId } = req.params;
 
     // Mock device status - in real implementation, query database
+    const now = Date.now();
+    const lastSeen = new Date(now - 2 * MINUTE_MS).toISOString();
     const deviceStatus = {
       device_id: deviceId,
       status: 'active',
-      last_seen: new Date(Date.now() - 2 * 60 * 1000).toISOString(),
+      last_seen: lastSeen,
       connectivity: {
         protocol: 'MQTT',
         signal_strength: 85,
         connection_quality: 'good',
       },
       latest_data: {
-        timestamp: new Date(Date.now() - 2 * 60 * 1000).toISOString(),
+        timestamp: lastSeen,
         energy_consumption: 125.5,
         power_demand: 5.2,
         voltage: 230.1,
@@ -318,7 +327,7 @@ router.get('/devices/:deviceId/status', async (req, res) => {
         {
           severity: 'info',
           message: 'Device operating normally',
-          timestamp: new Date().toISOString(),
+          timestamp: new Date(now).toISOString(),
         },
       ],
     };
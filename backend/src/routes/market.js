@@ -2,9 +2,20 @@ const express = require('express');
 const { query, validationResult } = require('express-validator');
 const MarketDataService = require('../services/marketDataService');
 const { authenticateToken } = require('../middleware/auth');
+const responseCache = require('../utils/responseCache');
 
 const router = express.Router();
 
+// Market analytics are identical for every caller, so share them briefly across requests
+const MARKET_CACHE_TTL_SECONDS = 15;
+
+function cachedAggregatedAnalytics(commodity, period) {
+  const key = `market:analytics:${commodity}:${period}`;
+  return responseCache.wrap(key, MARKET_CACHE_TTL_SECONDS, () =>
+    marketDataService.getAggregatedAnalytics(commodity, period)
+  );
+}
+
 // Initialize market data service with error handling
 let marketDataService;
 try {
@@ -115,7 +126,7 @@ router.get(
         });
       }
 
-      const analytics = await marketDataService.getAggregatedAnalytics(commodity, period);
+      const analytics = await cachedAggregatedAnalytics(commodity, period);
 
       res.json({
         success: true,
@@ -148,10 +159,11 @@ router.get(
 
       const { commodities, period = '30D' } = req.query;
 
-      // Parse commodities list or use all available
+      // Parse commodities list or use all available; deduped and sorted so that any
+      // ordering of the same commodities shares one cache entry
       const commodityList = commodities
-        ? commodities.split(',').filter(c => marketDataService.commodities[c])
-        : Object.keys(marketDataService.commodities);
+        ? [...new Set(commodities.split(','))].filter(c => marketDataService.commodities[c]).sort()
+        : Object.keys(marketDataService.commodities).sort();
 
       if (commodityList.length === 0) {
         return res.status(400).json({
@@ -160,7 +172,11 @@ router.get(
         });
       }
 
-      const report = await marketDataService.generateMarketReport(commodityList, period);
+      const report = await responseCache.wrap(
+        `market:report:${commodityList.join(',')}:${period}`,
+        MARKET_CACHE_TTL_SECONDS,
+        () => marketDataService.generateMarketReport(commodityList, period)
+      );
 
       res.json({
         success: true,
@@ -256,7 +272,7 @@ router.get(
         });
       }
 
-      const analytics = await marketDataService.getAggregatedAnalytics(commodity, period);
+      const analytics = await cachedAggregatedAnalytics(commodity, period);
 
       res.json({
         success: true,
@@ -304,7 +320,7 @@ router.get(
         });
       }
 
-      const analytics = await marketDataService.getAggregatedAnalytics(base, period);
+      const analytics = await cachedAggregatedAnalytics(base, period);
       const correlations = {};
 
       // Get correlations from the analytics
@@ -1,3 +1,4 @@
+const crypto = require('crypto');
 const express = require('express');
 const multer = require('multer');
 const { body, validationResult } = require('express-validator');
@@ -44,16 +45,38 @@ const ocrRateLimit = rateLimit({
   },
 });
 
+const SUPPORTED_LANGUAGES = Object.freeze([
+  'eng',
+  'ara',
+  'fas',
+  'chi_sim',
+  'rus',
+  'fra',
+  'spa',
+  'urd',
+]);
+
+// Status payload is static, so serialize it and derive its ETag once
+const OCR_STATUS_JSON = JSON.stringify({
+  service: 'OCR Service',
+  status: 'online',
+  supported_languages: SUPPORTED_LANGUAGES,
+  supported_formats: ['jpeg', 'png', 'tiff', 'bmp', 'webp', 'pdf'],
+  max_file_size: '50MB',
+  max_files_per_request: 10,
+});
+const OCR_STATUS_ETAG = `"${crypto
+  .createHash('sha256')
+  .update(OCR_STATUS_JSON)
+  .digest('base64url')}"`;
+
 // OCR Status endpoint
 router.get('/status', (req, res) => {
-  res.json({
-    service: 'OCR Service',
-    status: 'online',
-    supported_languages: ['eng', 'ara', 'fas', 'chi_sim', 'rus', 'fra', 'spa', 'urd'],
-    supported_formats: ['jpeg', 'png', 'tiff', 'bmp', 'webp', 'pdf'],
-    max_file_size: '50MB',
-    max_files_per_request: 10,
-  });
+  res.set({ ETag: OCR_STATUS_ETAG, 'Cache-Control': 'public, max-age=300' });
+  if (req.fresh) {
+    return res.status(304).end();
+  }
+  res.type('json').send(OCR_STATUS_JSON);
 });
 
 // Process single document with OCR
@@ -65,8 +88,8 @@ router.post(
   [
     body('language')
       .optional()
-      .isIn(['eng', 'ara', 'fas', 'chi_sim', 'rus', 'fra', 'spa', 'urd'])
-      .withMessage('Invalid language. Supported: eng, ara, fas, chi_sim, rus, fra, spa, urd'),
+      .isIn(SUPPORTED_LANGUAGES)
+      .withMessage(`Invalid language. Supported: ${SUPPORTED_LANGUAGES.join(', ')}`),
     body('extractFields').optional().isBoolean().withMessage('extractFields must be a boolean'),
     body('detectStamps').optional().isBoolean().withMessage('detectStamps must be a boolean'),
     body('detectSignatures')
@@ -124,7 +147,7 @@ router.post(
   authenticateToken,
   upload.array('documents', 10),
   [
-    body('language').optional().isIn(['eng', 'ara', 'fas', 'chi_sim', 'rus', 'fra', 'spa', 'urd']),
+    body('language').optional().isIn(SUPPORTED_LANGUAGES),
     body('extractFields').optional().isBoolean(),
     body('detectStamps').optional().isBoolean(),
     body('detectSignatures').optional().isBoolean(),
@@ -5,6 +5,10 @@ const EnhancedRegulatoryService = require('../services/enhancedRegulatoryService
 // Initialize service
 const regulatoryService = new EnhancedRegulatoryService();
 
+// Allowed export formats and their rejection message, built once rather than per request
+const SUPPORTED_EXPORT_FORMATS = Object.freeze(['XML', 'XBRL', 'CSV']);
+const UNSUPPORTED_EXPORT_FORMAT_ERROR = `Export format must be one of: ${SUPPORTED_EXPORT_FORMATS.join(', ')}`;
+
 /**
  * GET /api/regulatory/frameworks
  * Get all available regulatory frameworks
@@ -129,11 +133,10 @@ router.post('/reports/generate', async (req, res) => {
       });
     }
 
-    const supportedFormats = ['XML', 'XBRL', 'CSV'];
-    if (!supportedFormats.includes(exportFormat)) {
+    if (!SUPPORTED_EXPORT_FORMATS.includes(exportFormat)) {
       return res.status(400).json({
         success: false,
-        error: `Export format must be one of: ${supportedFormats.join(', ')}`,
+        error: UNSUPPORTED_EXPORT_FORMAT_ERROR,
         timestamp: new Date().toISOString(),
       });
     }
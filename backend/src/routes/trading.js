@@ -2,8 +2,14 @@ const express = require('express');
 const { body, query, validationResult } = require('express-validator');
 const TradingService = require('../services/tradingService');
 const { authenticateToken } = require('../middleware/auth');
+const responseCache = require('../utils/responseCache');
 
 const router = express.Router();
+
+// Orders move positions and P&L, so bump the user's analytics generation after every write.
+// Not awaited: the trade response does not wait on the cache, and invalidate never rejects
+const invalidateUserAnalytics = userId => responseCache.invalidate(`analytics:gen:${userId}`);
+
 // Simple /trade endpoint for PR3 compatibility
 router.get('/trade', (req, res) => res.send('Trade endpoint'));
 
@@ -76,6 +82,7 @@ router.post(
       };
 
       const order = await tradingService.placeOrder(orderRequest);
+      invalidateUserAnalytics(req.user.id);
 
       res.status(201).json({
         success: true,
@@ -243,6 +250,7 @@ router.put(
       }
 
       const modifiedOrder = await tradingService.modifyOrder(orderId, req.body);
+      invalidateUserAnalytics(req.user.id);
 
       res.json({
         success: true,
@@ -287,6 +295,7 @@ router.delete('/orders/:orderId', authenticateToken, async (req, res) => {
     }
 
     const cancelledOrder = await tradingService.cancelOrder(orderId);
+    invalidateUserAnalytics(req.user.id);
 
     res.json({
       success: true,
@@ -9,6 +9,7 @@ import winston from 'winston';
 import rateLimit from 'express-rate-limit';
 import slowDown from 'express-slow-down';
 import { createServer } from 'http';
+import { createHash } from 'crypto';
 import { Server as SocketIOServer } from 'socket.io';
 import swaggerUi from 'swagger-ui-express';
 import swaggerSpec from './swagger/config.js';
@@ -22,6 +23,8 @@ import { WebhookManager } from './webhooks/webhookManager';
 import { PluginManager } from './plugins/pluginManager';
 import { SecurityMiddleware } from './middleware/security';
 
+const responseCache = require('./utils/responseCache');
+
 // Load environment variables
 dotenv.config();
 
@@ -79,23 +82,29 @@ const securityMiddleware = new SecurityMiddleware({
   preload: true,
 });
 
+// Initialize Kafka service (skip if disabled for local development)
+async function initializeKafka(): Promise<void> {
+  if (process.env.NODE_ENV !== 'test' && process.env.KAFKA_ENABLED !== 'false') {
+    try {
+      kafkaService = getKafkaService(logger);
+      await kafkaService.initialize();
+      logger.info('Kafka service initialized');
+    } catch (error) {
+      logger.warn('Failed to initialize Kafka service, continuing without it', {
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  } else {
+    logger.info('Kafka service disabled for this environment');
+  }
+}
+
 // Initialize all services
 async function initializeServices(): Promise<void> {
   try {
-    // Initialize Kafka service (skip if disabled for local development)
-    if (process.env.NODE_ENV !== 'test' && process.env.KAFKA_ENABLED !== 'false') {
-      try {
-        kafkaService = getKafkaService(logger);
-        await kafkaService.initialize();
-        logger.info('Kafka service initialized');
-      } catch (error) {
-        logger.warn('Failed to initialize Kafka service, continuing without it', {
-          error: error instanceof Error ? error.message : String(error),
-        });
-      }
-    } else {
-      logger.info('Kafka service disabled for this environment');
-    }
+    // Kafka connect and plugin loading are independent, so neither waits on the other
+    pluginManager = new PluginManager(logger);
+    const [, plugins] = await Promise.allSettled([initializeKafka(), pluginManager.initialize()]);
 
     // Initialize WebSocket service
     websocketService = new WebSocketService(io, kafkaService, logger);
@@ -105,9 +114,9 @@ async function initializeServices(): Promise<void> {
     webhookManager = new WebhookManager(logger);
     logger.info('Webhook manager initialized');
 
-    // Initialize Plugin manager
-    pluginManager = new PluginManager(logger);
-    await pluginManager.initialize();
+    if (plugins.status === 'rejected') {
+      throw plugins.reason;
+    }
     logger.info('Plugin manager initialized');
 
     // Initialize gRPC service (keeping existing functionality)
@@ -189,24 +198,33 @@ try {
   openApiSpec = swaggerSpec;
 }
 
+// The spec is fixed for the life of the process, so render the UI page and both
+// serializations once instead of on every request
+const swaggerUiHandler = swaggerUi.setup(openApiSpec, swaggerUiOptions);
+const openApiJson = JSON.stringify(openApiSpec);
+const openApiYaml = yaml.stringify(openApiSpec, 2);
+const openApiEtag = `"${createHash('sha256').update(openApiJson).digest('base64url')}"`;
+
+const sendOpenApiSpec =
+  (body: string, contentType: string) =>
+  (req: Request, res: Response): void => {
+    res.set({ ETag: openApiEtag, 'Cache-Control': 'public, max-age=86400' });
+    if (req.fresh) {
+      res.status(304).end();
+      return;
+    }
+    res.type(contentType).send(body);
+  };
+
 // Serve Swagger UI at /api-docs
 app.use('/api-docs', swaggerUi.serve as any);
-app.get('/api-docs', (req: Request, res: Response, next: NextFunction) => {
-  const swaggerHandler = swaggerUi.setup(openApiSpec, swaggerUiOptions);
-  (swaggerHandler as any)(req, res, next);
-});
+app.get('/api-docs', swaggerUiHandler as any);
 
 // Serve OpenAPI spec as JSON
-app.get('/api-docs.json', (req: Request, res: Response): void => {
-  res.setHeader('Content-Type', 'application/json');
-  res.send(openApiSpec);
-});
+app.get('/api-docs.json', sendOpenApiSpec(openApiJson, 'application/json'));
 
 // Serve OpenAPI spec as YAML
-app.get('/api-docs.yaml', (req: Request, res: Response): void => {
-  res.setHeader('Content-Type', 'text/yaml');
-  res.send(yaml.stringify(openApiSpec, 2));
-});
+app.get('/api-docs.yaml', sendOpenApiSpec(openApiYaml, 'text/yaml'));
 
 // Global rate limiting
 const globalLimiter = rateLimit({
@@ -399,6 +417,43 @@ app.get('/api/v1/websocket/stats', (req: Request, res: Response): void => {
   }
 });
 
+/**
+ * @swagger
+ * /api/v1/cache/stats:
+ *   get:
+ *     tags:
+ *       - System
+ *     summary: Get response cache statistics
+ *     description: Get hit/miss counters for the analytics response cache
+ *     responses:
+ *       200:
+ *         description: Cache stats retrieved successfully
+ *         content:
+ *           application/json:
+ *             schema:
+ *               allOf:
+ *                 - $ref: '#/components/schemas/APIResponse'
+ *                 - type: object
+ *                   properties:
+ *                     data:
+ *                       type: object
+ *                       properties:
+ *                         hits:
+ *                           type: integer
+ *                         misses:
+ *                           type: integer
+ *                         hitRatio:
+ *                           type: number
+ */
+// Response cache stats endpoint
+app.get('/api/v1/cache/stats', (req: Request, res: Response): void => {
+  res.json({
+    success: true,
+    data: responseCache.getStats(),
+    timestamp: new Date(),
+  });
+});
+
 /**
  * @swagger
  * /api/v1/plugins:
@@ -1,8 +1,68 @@
 const { EventEmitter } = require('events');
+const https = require('https');
 const axios = require('axios');
 const Joi = require('joi');
 const { v4: uuidv4 } = require('uuid');
 
+// Schemas are compiled once at load instead of rebuilt on every validation call
+const VALIDATION_OPTIONS = Object.freeze({ abortEarly: false });
+
+const CFTC_FORM_102_SCHEMA = Joi.object({
+  reportingEntity: Joi.object({
+    name: Joi.string().min(1).max(200).required(),
+    cftcId: Joi.string().pattern(/^[A-Z0-9]{10}$/).required(),
+    address: Joi.string().min(10).max(500).required(),
+    contactPerson: Joi.string().min(1).max(100).required(),
+    contactEmail: Joi.string().email().required(),
+    contactPhone: Joi.string().pattern(/^\+?[1-9]\d{1,14}$/).required(),
+  }).required(),
+  reportingPeriod: Joi.object({
+    startDate: Joi.date().required(),
+    endDate: Joi.date().greater(Joi.ref('startDate')).required(),
+  }).required(),
+  positions: Joi.array().items(Joi.object({
+    commodity: Joi.string().valid('crude_oil', 'natural_gas', 'heating_oil', 'gasoline', 'propane').required(),
+    contractMonth: Joi.string().pattern(/^[A-Z]{3}\d{2}$/).required(),
+    longQuantity: Joi.number().min(0).required(),
+    shortQuantity: Joi.number().min(0).required(),
+    netQuantity: Joi.number().required(),
+    notionalValue: Joi.number().min(0).required(),
+  })).min(1).required(),
+  aggregateData: Joi.object({
+    totalLongPositions: Joi.number().min(0).required(),
+    totalShortPositions: Joi.number().min(0).required(),
+    totalNotionalValue: Joi.number().min(0).required(),
+  }).required(),
+});
+
+const MAS_610A_SCHEMA = Joi.object({
+  institutionDetails: Joi.object({
+    name: Joi.string().min(1).max(200).required(),
+    masLicenseNumber: Joi.string().pattern(/^[A-Z]{2}\d{6}$/).required(),
+    reportingDate: Joi.date().max('now').required(),
+    contactOfficer: Joi.string().min(1).max(100).required(),
+    contactEmail: Joi.string().email().required(),
+  }).required(),
+  commodityDerivatives: Joi.array().items(Joi.object({
+    productType: Joi.string().valid('future', 'option', 'swap', 'forward').required(),
+    underlyingCommodity: Joi.string().required(),
+    notionalAmount: Joi.number().min(0).required(),
+    currency: Joi.string().length(3).uppercase().required(),
+    maturityDate: Joi.date().greater('now').required(),
+    counterpartyType: Joi.string().valid('bank', 'corporate', 'fund', 'other').required(),
+    riskMetrics: Joi.object({
+      deltaEquivalent: Joi.number().required(),
+      vegaEquivalent: Joi.number().optional(),
+      dv01: Joi.number().optional(),
+    }).required(),
+  })).required(),
+  riskSummary: Joi.object({
+    totalNotional: Joi.number().min(0).required(),
+    netDeltaEquivalent: Joi.number().required(),
+    varEstimate: Joi.number().min(0).required(),
+  }).required(),
+});
+
 /**
  * CFTC and MAS Compliance Service
  * Handles automated filing of regulatory forms with retry logic and audit logging
@@ -31,6 +91,9 @@ class CFTCComplianceService extends EventEmitter {
       keyPath: process.env.MAS_KEY_PATH || '',
       timeout: parseInt(process.env.MAS_TIMEOUT || '45000'),
     };
+
+    // Shared keep-alive agent so submissions, retries and status polls reuse TLS connections
+    this.httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 32 });
   }
 
   /**
@@ -205,35 +268,7 @@ class CFTCComplianceService extends EventEmitter {
    * Validate CFTC Form 102 data
    */
   validateCFTCForm102(data) {
-    const schema = Joi.object({
-      reportingEntity: Joi.object({
-        name: Joi.string().min(1).max(200).required(),
-        cftcId: Joi.string().pattern(/^[A-Z0-9]{10}$/).required(),
-        address: Joi.string().min(10).max(500).required(),
-        contactPerson: Joi.string().min(1).max(100).required(),
-        contactEmail: Joi.string().email().required(),
-        contactPhone: Joi.string().pattern(/^\+?[1-9]\d{1,14}$/).required(),
-      }).required(),
-      reportingPeriod: Joi.object({
-        startDate: Joi.date().required(),
-        endDate: Joi.date().greater(Joi.ref('startDate')).required(),
-      }).required(),
-      positions: Joi.array().items(Joi.object({
-        commodity: Joi.string().valid('crude_oil', 'natural_gas', 'heating_oil', 'gasoline', 'propane').required(),
-        contractMonth: Joi.string().pattern(/^[A-Z]{3}\d{2}$/).required(),
-        longQuantity: Joi.number().min(0).required(),
-        shortQuantity: Joi.number().min(0).required(),
-        netQuantity: Joi.number().required(),
-        notionalValue: Joi.number().min(0).required(),
-      })).min(1).required(),
-      aggregateData: Joi.object({
-        totalLongPositions: Joi.number().min(0).required(),
-        totalShortPositions: Joi.number().min(0).required(),
-        totalNotionalValue: Joi.number().min(0).required(),
-      }).required(),
-    });
-
-    const { error } = schema.validate(data, { abortEarly: false });
+    const { error } = CFTC_FORM_102_SCHEMA.validate(data, VALIDATION_OPTIONS);
     
     if (error) {
       return {
@@ -272,35 +307,7 @@ class CFTCComplianceService extends EventEmitter {
    * Validate MAS 610A data
    */
   validateMAS610A(data) {
-    const schema = Joi.object({
-      institutionDetails: Joi.object({
-        name: Joi.string().min(1).max(200).required(),
-        masLicenseNumber: Joi.string().pattern(/^[A-Z]{2}\d{6}$/).required(),
-        reportingDate: Joi.date().max('now').required(),
-        contactOfficer: Joi.string().min(1).max(100).required(),
-        contactEmail: Joi.string().email().required(),
-      }).required(),
-      commodityDerivatives: Joi.array().items(Joi.object({
-        productType: Joi.string().valid('future', 'option', 'swap', 'forward').required(),
-        underlyingCommodity: Joi.string().required(),
-        notionalAmount: Joi.number().min(0).required(),
-        currency: Joi.string().length(3).uppercase().required(),
-        maturityDate: Joi.date().greater('now').required(),
-        counterpartyType: Joi.string().valid('bank', 'corporate', 'fund', 'other').required(),
-        riskMetrics: Joi.object({
-          deltaEquivalent: Joi.number().required(),
-          vegaEquivalent: Joi.number().optional(),
-          dv01: Joi.number().optional(),
-        }).required(),
-      })).required(),
-      riskSummary: Joi.object({
-        totalNotional: Joi.number().min(0).required(),
-        netDeltaEquivalent: Joi.number().required(),
-        varEstimate: Joi.number().min(0).required(),
-      }).required(),
-    });
-
-    const { error } = schema.validate(data, { abortEarly: false });
+    const { error } = MAS_610A_SCHEMA.validate(data, VALIDATION_OPTIONS);
     
     if (error) {
       return {
@@ -348,6 +355,7 @@ class CFTCComplianceService extends EventEmitter {
           'X-Submission-Id': submissionId,
         },
         timeout: this.cftcConfig.timeout,
+        httpsAgent: this.httpsAgent,
       }
     );
 
@@ -381,6 +389,7 @@ class CFTCComplianceService extends EventEmitter {
         },
         timeout: this.masConfig.timeout,
         // In production: httpsAgent with client certificates
+        httpsAgent: this.httpsAgent,
       }
     );
 
@@ -499,6 +508,7 @@ class CFTCComplianceService extends EventEmitter {
             { 'Authorization': `Bearer ${this.cftcConfig.apiKey}` } : 
             { 'X-Service': 'quantenergx' },
           timeout: 15000,
+          httpsAgent: this.httpsAgent,
         }
       );
 
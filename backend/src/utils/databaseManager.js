@@ -9,9 +9,12 @@ class DatabaseManager {
     this.pool = new Pool({
       connectionString: process.env.DATABASE_URL,
       ssl: process.env.NODE_ENV === 'production' ? { rejectUnauthorized: false } : false,
-      max: 20,
-      idleTimeoutMillis: 30000,
-      connectionTimeoutMillis: 2000,
+      max: parseInt(process.env.DB_POOL_SIZE || '20'),
+      idleTimeoutMillis: parseInt(process.env.DB_POOL_IDLE_TIMEOUT || '30000'),
+      // Fail fast by default; raise DB_POOL_TIMEOUT to let bursts queue for a connection
+      connectionTimeoutMillis: parseInt(process.env.DB_POOL_TIMEOUT || '2000'),
+      // TCP keepalive so idle pooled connections dropped by the network are detected
+      keepAlive: true,
     });
 
     this.pool.on('error', err => {
@@ -39,9 +42,11 @@ class DatabaseManager {
     const client = await this.pool.connect();
 
     try {
-      // Set user context for RLS
-      await client.query('SELECT set_current_user_id($1)', [userId]);
-      await client.query('SELECT set_current_user_role($1)', [userRole]);
+      // Set user context for RLS in a single round trip
+      await client.query('SELECT set_current_user_id($1), set_current_user_role($2)', [
+        userId,
+        userRole,
+      ]);
 
       return {
         client,
@@ -293,15 +298,19 @@ class DatabaseManager {
 
       -- Create indexes for performance
       CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+      CREATE INDEX IF NOT EXISTS idx_users_active_role ON users(role) WHERE is_active;
       CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
       CREATE INDEX IF NOT EXISTS idx_user_sessions_token ON user_sessions(session_token);
       CREATE INDEX IF NOT EXISTS idx_user_sessions_user_id ON user_sessions(user_id);
-      CREATE INDEX IF NOT EXISTS idx_trading_orders_user_id ON trading_orders(user_id);
+      -- Per-user history reads ("latest orders/changes for user X") walk these in index order
+      CREATE INDEX IF NOT EXISTS idx_trading_orders_user_created ON trading_orders(user_id, created_at DESC);
       CREATE INDEX IF NOT EXISTS idx_trading_orders_symbol ON trading_orders(symbol);
       CREATE INDEX IF NOT EXISTS idx_api_keys_user_id ON api_keys(user_id);
-      CREATE INDEX IF NOT EXISTS idx_audit_logs_user_id ON audit_logs(user_id);
+      CREATE INDEX IF NOT EXISTS idx_audit_logs_user_changed ON audit_logs(user_id, changed_at DESC);
+      -- audit_logs is append-only, so a BRIN index covers time-range scans at a fraction of the size
+      CREATE INDEX IF NOT EXISTS idx_audit_logs_changed_at ON audit_logs USING BRIN (changed_at);
       CREATE INDEX IF NOT EXISTS idx_audit_logs_table_name ON audit_logs(table_name);
-      CREATE INDEX IF NOT EXISTS idx_market_data_symbol ON market_data(symbol);
+      -- market_data symbol/time-range lookups use the UNIQUE(symbol, timestamp, source) index
       CREATE INDEX IF NOT EXISTS idx_market_data_timestamp ON market_data(timestamp);
       CREATE INDEX IF NOT EXISTS idx_compliance_reports_subject_user_id ON compliance_reports(subject_user_id);
       CREATE INDEX IF NOT EXISTS idx_risk_assessments_user_id ON risk_assessments(user_id);
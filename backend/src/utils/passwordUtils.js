@@ -12,9 +12,9 @@ class PasswordUtils {
     this.bcryptRounds = parseInt(process.env.BCRYPT_ROUNDS) || 12;
     this.argon2Options = {
       type: argon2.argon2id,
-      memoryCost: 2 ** 16, // 64 MB
-      timeCost: 3,
-      parallelism: 1,
+      memoryCost: parseInt(process.env.ARGON2_MEMORY_COST) || 2 ** 16, // KiB, 64 MB default
+      timeCost: parseInt(process.env.ARGON2_TIME_COST) || 2, // two passes keep login latency low
+      parallelism: parseInt(process.env.ARGON2_PARALLELISM) || 1,
     };
   }
 
@@ -74,14 +74,14 @@ class PasswordUtils {
   }
 
   /**
-   * Check if password hash needs rehashing (algorithm upgrade)
+   * Check if password hash needs rehashing (algorithm or cost parameter upgrade)
    * @param {string} hash - Stored hash
    * @returns {boolean} - True if rehashing is needed
    */
   needsRehash(hash) {
     if (!hash) return true;
 
-    const [algorithm] = hash.split(':', 2);
+    const [algorithm, actualHash] = hash.split(':', 2);
 
     // If no algorithm prefix, needs upgrade
     if (!algorithm || algorithm === hash) {
@@ -89,7 +89,19 @@ class PasswordUtils {
     }
 
     // If current algorithm is different from stored, needs upgrade
-    return algorithm !== this.algorithm;
+    if (algorithm !== this.algorithm) {
+      return true;
+    }
+
+    // Same algorithm, so only rehash when the stored cost parameters are stale
+    try {
+      if (algorithm === 'argon2') {
+        return argon2.needsRehash(actualHash, this.argon2Options);
+      }
+      return bcrypt.getRounds(actualHash) !== this.bcryptRounds;
+    } catch (_error) {
+      return true;
+    }
   }
 
   /**
@@ -0,0 +1,192 @@
+const redis = require('redis');
+
+// Bound on the in-memory fallback; keys embed query values, so clients can mint new ones
+const MEMORY_CACHE_SIZE = 4096;
+
+/**
+ * Short-lived response cache for read-heavy API endpoints
+ * Uses Redis when configured and falls back to an in-process TTL map
+ */
+class ResponseCache {
+  constructor() {
+    this.memory = new Map();
+    // Namespace generation counters for the in-memory fallback
+    this.generations = new Map();
+    this.redisClient = null;
+    // Computations in progress per key, so concurrent misses share one compute
+    this.inFlight = new Map();
+    // Hit/miss counters for tuning TTLs
+    this.stats = { hits: 0, misses: 0 };
+
+    if (process.env.REDIS_HOST && process.env.NODE_ENV !== 'test') {
+      this.initializeRedis();
+    }
+  }
+
+  initializeRedis() {
+    const client = redis.createClient({
+      socket: {
+        host: process.env.REDIS_HOST,
+        port: parseInt(process.env.REDIS_PORT) || 6379,
+      },
+    });
+
+    client.on('error', error => {
+      console.warn('Response cache Redis error:', error.message);
+    });
+
+    client
+      .connect()
+      .then(() => {
+        this.redisClient = client;
+      })
+      .catch(error => {
+        console.warn('Response cache falling back to memory:', error.message);
+      });
+  }
+
+  /**
+   * Get a cached value
+   * @param {string} key - Cache key
+   * @returns {Promise<*>} - Cached value or null when missing/expired
+   */
+  async get(key) {
+    if (this.redisClient) {
+      try {
+        const cached = await this.redisClient.get(key);
+        return cached ? JSON.parse(cached) : null;
+      } catch (error) {
+        console.warn('Response cache read failed:', error.message);
+        return null;
+      }
+    }
+
+    const entry = this.memory.get(key);
+    if (!entry) return null;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.memory.delete(key);
+      return null;
+    }
+
+    return entry.value;
+  }
+
+  /**
+   * Store a value with a TTL
+   * @param {string} key - Cache key
+   * @param {*} value - JSON-serializable value
+   * @param {number} ttlSeconds - Time to live in seconds
+   */
+  async set(key, value, ttlSeconds) {
+    if (this.redisClient) {
+      try {
+        await this.redisClient.set(key, JSON.stringify(value), { EX: ttlSeconds });
+      } catch (error) {
+        console.warn('Response cache write failed:', error.message);
+      }
+      return;
+    }
+
+    const now = Date.now();
+    // Expired entries are otherwise only dropped when their own key is read again
+    for (const [cachedKey, entry] of this.memory) {
+      if (entry.expiresAt <= now) {
+        this.memory.delete(cachedKey);
+      }
+    }
+
+    // Re-inserting moves a refreshed key to the newest end of the eviction order
+    this.memory.delete(key);
+    if (this.memory.size >= MEMORY_CACHE_SIZE) {
+      // Map iterates in insertion order, so the first key is the oldest entry
+      this.memory.delete(this.memory.keys().next().value);
+    }
+
+    this.memory.set(key, { value, expiresAt: now + ttlSeconds * 1000 });
+  }
+
+  /**
+   * Return the cached value for key, computing and storing it on a miss
+   * @param {string} key - Cache key
+   * @param {number} ttlSeconds - Time to live in seconds
+   * @param {Function} compute - Async producer for the value
+   * @returns {Promise<*>} - Cached or freshly computed value
+   */
+  async wrap(key, ttlSeconds, compute) {
+    const cached = await this.get(key);
+    if (cached !== null) {
+      this.stats.hits++;
+      return cached;
+    }
+
+    // Join a computation another caller already started for this key
+    const pending = this.inFlight.get(key);
+    if (pending) {
+      this.stats.hits++;
+      return pending;
+    }
+
+    this.stats.misses++;
+    const promise = Promise.resolve()
+      .then(compute)
+      .then(async value => {
+        await this.set(key, value, ttlSeconds);
+        return value;
+      })
+      .finally(() => {
+        this.inFlight.delete(key);
+      });
+    this.inFlight.set(key, promise);
+    return promise;
+  }
+
+  /**
+   * Get the current generation of a namespace, for embedding in its cache keys
+   * @param {string} generationKey - Key holding the namespace's generation counter
+   * @returns {Promise<number>} - Generation number, 0 if never invalidated
+   */
+  async getGeneration(generationKey) {
+    if (this.redisClient) {
+      try {
+        return parseInt(await this.redisClient.get(generationKey)) || 0;
+      } catch (error) {
+        console.warn('Response cache read failed:', error.message);
+        return 0;
+      }
+    }
+
+    return this.generations.get(generationKey) || 0;
+  }
+
+  /**
+   * Get cache hit/miss counters
+   * @returns {Object} - Hits, misses and hit ratio
+   */
+  getStats() {
+    const { hits, misses } = this.stats;
+    const total = hits + misses;
+    return { hits, misses, hitRatio: total > 0 ? hits / total : 0 };
+  }
+
+  /**
+   * Invalidate a namespace by bumping its generation
+   * Keys built from the old generation are never read again and age out by TTL,
+   * so this is one INCR regardless of how many entries the namespace holds
+   * @param {string} generationKey - Key holding the namespace's generation counter
+   */
+  async invalidate(generationKey) {
+    if (this.redisClient) {
+      try {
+        await this.redisClient.incr(generationKey);
+      } catch (error) {
+        console.warn('Response cache invalidation failed:', error.message);
+      }
+      return;
+    }
+
+    this.generations.set(generationKey, (this.generations.get(generationKey) || 0) + 1);
+  }
+}
+
+module.exports = new ResponseCache();
@@ -1,5 +1,9 @@
 const winston = require('winston');
 const path = require('path');
+const { performance } = require('perf_hooks');
+
+// Emit log lines in insertion order; the default json format sorts every record's keys
+const jsonLineFormat = winston.format.json({ deterministic: false });
 
 /**
  * Enhanced logging and monitoring utility
@@ -27,7 +31,7 @@ class SecurityLogger {
       format: winston.format.combine(
         winston.format.timestamp(),
         winston.format.errors({ stack: true }),
-        winston.format.json()
+        jsonLineFormat
       ),
       defaultMeta: { service: 'quantenergx-backend' },
       transports: [
@@ -48,7 +52,7 @@ class SecurityLogger {
     // Security-specific logger
     this.securityLogger = winston.createLogger({
       level: 'info',
-      format: winston.format.combine(winston.format.timestamp(), winston.format.json()),
+      format: winston.format.combine(winston.format.timestamp(), jsonLineFormat),
       defaultMeta: { service: 'quantenergx-security' },
       transports: [
         new winston.transports.File({
@@ -62,7 +66,7 @@ class SecurityLogger {
     // Audit logger for compliance
     this.auditLogger = winston.createLogger({
       level: 'info',
-      format: winston.format.combine(winston.format.timestamp(), winston.format.json()),
+      format: winston.format.combine(winston.format.timestamp(), jsonLineFormat),
       defaultMeta: { service: 'quantenergx-audit' },
       transports: [
         new winston.transports.File({
@@ -264,33 +268,38 @@ class SecurityLogger {
    */
   requestLogger() {
     return (req, res, next) => {
-      const startTime = Date.now();
+      // Check the level once so disabled info logging costs no payload construction
+      const infoEnabled = this.logger.isInfoEnabled();
+      // Monotonic clock, so durations are immune to wall-clock adjustments
+      const startTime = infoEnabled ? performance.now() : 0;
 
       // Log request
-      this.logger.info('HTTP Request', {
-        method: req.method,
-        url: req.url,
-        ip: req.ip,
-        userAgent: req.get('User-Agent'),
-        userId: req.user?.id || null,
-        timestamp: new Date().toISOString(),
-      });
-
-      // Override res.end to log response
-      const originalEnd = res.end;
-      res.end = function (...args) {
-        const duration = Date.now() - startTime;
-
-        // Log response
-        this.logger.info('HTTP Response', {
+      if (infoEnabled) {
+        this.logger.info('HTTP Request', {
           method: req.method,
           url: req.url,
-          statusCode: res.statusCode,
-          duration,
           ip: req.ip,
+          userAgent: req.get('User-Agent'),
           userId: req.user?.id || null,
           timestamp: new Date().toISOString(),
         });
+      }
+
+      // Override res.end to log response
+      const originalEnd = res.end;
+      res.end = function (...args) {
+        // Log response
+        if (infoEnabled) {
+          this.logger.info('HTTP Response', {
+            method: req.method,
+            url: req.url,
+            statusCode: res.statusCode,
+            duration: Math.round(performance.now() - startTime),
+            ip: req.ip,
+            userId: req.user?.id || null,
+            timestamp: new Date().toISOString(),
+          });
+        }
 
         // Check for 5xx errors
         if (res.statusCode >= 500) {
@@ -310,10 +310,13 @@ export class WebSocketService {
 
     this.io.to(roomName).emit('market-update', wsMessage);
 
-    this.logger.debug(`Market data broadcasted to room ${roomName}`, {
-      commodity: marketData.commodity,
-      price: marketData.price,
-    });
+    // Per-tick path: skip building the message when debug output is off
+    if (this.logger.isDebugEnabled()) {
+      this.logger.debug(`Market data broadcasted to room ${roomName}`, {
+        commodity: marketData.commodity,
+        price: marketData.price,
+      });
+    }
   }
 
   /**
@@ -332,10 +335,12 @@ export class WebSocketService {
 
     this.io.to(roomName).emit('trade-update', wsMessage);
 
-    this.logger.debug(`Trade update sent to user ${tradeData.userId}`, {
-      tradeId: tradeData.id,
-      status: tradeData.status,
-    });
+    if (this.logger.isDebugEnabled()) {
+      this.logger.debug(`Trade update sent to user ${tradeData.userId}`, {
+        tradeId: tradeData.id,
+        status: tradeData.status,
+      });
+    }
   }
 
   /**
@@ -354,10 +359,12 @@ export class WebSocketService {
 
     this.io.to(roomName).emit('order-update', wsMessage);
 
-    this.logger.debug(`Order update sent to user ${orderData.userId}`, {
-      orderId: orderData.id,
-      status: orderData.status,
-    });
+    if (this.logger.isDebugEnabled()) {
+      this.logger.debug(`Order update sent to user ${orderData.userId}`, {
+        orderId: orderData.id,
+        status: orderData.status,
+      });
+    }
   }
 
   /**
@@ -497,6 +497,20 @@ describe('CFTCComplianceService - US and Singapore Region Tests', () => {
       );
     });
 
+    test('should reuse the shared keep-alive agent across requests', async () => {
+      axios.get
+        .mockResolvedValueOnce({ data: { status: 'processing' } })
+        .mockResolvedValueOnce({ data: { status: 'acknowledged' } });
+
+      await complianceService.getSubmissionStatus('test-123', 'cftc');
+      await complianceService.getSubmissionStatus('mas-456', 'mas');
+
+      const agents = axios.get.mock.calls.map(([, config]) => config.httpsAgent);
+      expect(agents[0]).toBe(complianceService.httpsAgent);
+      expect(agents[1]).toBe(agents[0]);
+      expect(complianceService.httpsAgent.keepAlive).toBe(true);
+    });
+
     test('should get MAS submission status', async () => {
       const mockStatusResponse = {
         data: {
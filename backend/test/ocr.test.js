@@ -47,6 +47,18 @@ describe('OCR Service API Tests', () => {
       expect(response.body.supported_languages).toContain('eng');
       expect(response.body.supported_languages).toContain('ara');
     });
+
+    it('should return 304 when the client ETag matches', async () => {
+      const first = await request(app).get('/api/v1/ocr/status').expect(200);
+
+      expect(first.headers.etag).toBeDefined();
+      expect(first.headers['cache-control']).toContain('max-age');
+
+      await request(app)
+        .get('/api/v1/ocr/status')
+        .set('If-None-Match', first.headers.etag)
+        .expect(304);
+    });
   });
 
   describe('GET /api/v1/notifications/channels', () => {
@@ -144,6 +144,15 @@ describe('Password Utility Tests', () => {
     expect(isInvalid).toBe(false);
   });
 
+  test('should only flag stale hashes for rehash', async () => {
+    const password = 'TestPassword123!';
+    const hash = await passwordUtils.hashPassword(password);
+
+    expect(passwordUtils.needsRehash(hash)).toBe(false);
+    expect(passwordUtils.needsRehash(hash.replace(/t=\d+/, 't=1'))).toBe(true);
+    expect(passwordUtils.needsRehash('legacyhashwithoutprefix')).toBe(true);
+  });
+
   test('should validate password strength', () => {
     const strongPassword = 'StrongPassword123!';
     const weakPassword = '123';
@@ -0,0 +1,17 @@
+// Jest transform for TypeScript sources required from JS suites; type-checking is left to tsc
+const ts = require('typescript');
+
+module.exports = {
+  process(sourceText, sourcePath) {
+    const { outputText, sourceMapText } = ts.transpileModule(sourceText, {
+      fileName: sourcePath,
+      compilerOptions: {
+        module: ts.ModuleKind.CommonJS,
+        target: ts.ScriptTarget.ES2020,
+        esModuleInterop: true,
+        sourceMap: true,
+      },
+    });
+    return { code: outputText, map: sourceMapText };
+  },
+};
@@ -0,0 +1,49 @@
+const jwt = require('jsonwebtoken');
+const { authenticateToken, clearVerifiedTokens } = require('../../src/middleware/auth');
+
+const secret = process.env.JWT_SECRET || 'fallback-secret-key';
+
+const mockResponse = () => {
+  const res = {};
+  res.status = jest.fn().mockReturnValue(res);
+  res.json = jest.fn().mockReturnValue(res);
+  return res;
+};
+
+describe('authenticateToken', () => {
+  beforeEach(() => {
+    clearVerifiedTokens();
+  });
+
+  it('should verify a token once and serve repeat requests from the cache', () => {
+    const token = jwt.sign({ id: 'user1', role: 'trader' }, secret, { expiresIn: '1h' });
+    const verifySpy = jest.spyOn(jwt, 'verify');
+
+    const first = { headers: { authorization: `Bearer ${token}` } };
+    const second = { headers: { authorization: `Bearer ${token}` } };
+    const next = jest.fn();
+
+    authenticateToken(first, mockResponse(), next);
+    authenticateToken(second, mockResponse(), next);
+
+    expect(next).toHaveBeenCalledTimes(2);
+    expect(first.user.id).toBe('user1');
+    expect(second.user.id).toBe('user1');
+    expect(second.user).toBe(first.user);
+    expect(Object.isFrozen(second.user)).toBe(true);
+    expect(verifySpy).toHaveBeenCalledTimes(1);
+
+    verifySpy.mockRestore();
+  });
+
+  it('should reject tokens signed with a different secret', () => {
+    const token = jwt.sign({ id: 'user1' }, 'some-other-secret');
+    const res = mockResponse();
+    const next = jest.fn();
+
+    authenticateToken({ headers: { authorization: `Bearer ${token}` } }, res, next);
+
+    expect(res.status).toHaveBeenCalledWith(403);
+    expect(next).not.toHaveBeenCalled();
+  });
+});
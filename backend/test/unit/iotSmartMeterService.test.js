@@ -0,0 +1,42 @@
+const IoTSmartMeterService = require('../../../src/backend/services/iotSmartMeterService');
+
+describe('IoTSmartMeterService renewable production monitoring', () => {
+  let service;
+
+  beforeEach(() => {
+    service = new IoTSmartMeterService();
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should average capacity factors over the facilities that reported', async () => {
+    jest.spyOn(service, 'getFacilityProduction').mockImplementation(async facilityId => {
+      if (facilityId === 'offline') throw new Error('Facility unreachable');
+      return { facility_id: facilityId, total_production: 100, capacity_factor: 20 };
+    });
+
+    const result = await service.monitorRenewableProduction(['solar_1', 'offline', 'wind_1']);
+
+    expect(result.success).toBe(true);
+    expect(result.total_production).toBe(200);
+    expect(result.average_capacity_factor).toBe(20);
+    expect(result.unavailable_facilities).toEqual([
+      { facility_id: 'offline', status: 'unknown', error: 'Facility unreachable' },
+    ]);
+  });
+
+  it('should report a null capacity factor when every facility is unavailable', async () => {
+    const unreachable = new Error('Facility unreachable');
+    jest.spyOn(service, 'getFacilityProduction').mockRejectedValue(unreachable);
+
+    const result = await service.monitorRenewableProduction(['solar_1', 'wind_1']);
+
+    expect(result.success).toBe(true);
+    expect(result.total_production).toBe(0);
+    expect(result.average_capacity_factor).toBeNull();
+    expect(result.production_data).toEqual([]);
+    expect(result.unavailable_facilities).toHaveLength(2);
+  });
+});
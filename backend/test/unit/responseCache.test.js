@@ -0,0 +1,93 @@
+const responseCache = require('../../src/utils/responseCache');
+
+describe('ResponseCache (in-memory)', () => {
+  beforeEach(() => {
+    responseCache.memory.clear();
+    responseCache.inFlight.clear();
+    responseCache.generations.clear();
+    responseCache.stats = { hits: 0, misses: 0 };
+  });
+
+  it('should compute once and serve subsequent hits from cache', async () => {
+    const compute = jest.fn().mockResolvedValue({ value: 42 });
+
+    const first = await responseCache.wrap('analytics:user1:test:{}', 60, compute);
+    const second = await responseCache.wrap('analytics:user1:test:{}', 60, compute);
+
+    expect(first).toEqual({ value: 42 });
+    expect(second).toEqual({ value: 42 });
+    expect(compute).toHaveBeenCalledTimes(1);
+    expect(responseCache.getStats()).toEqual({ hits: 1, misses: 1, hitRatio: 0.5 });
+  });
+
+  it('should share one computation between concurrent misses', async () => {
+    let resolveCompute;
+    const compute = jest.fn(
+      () =>
+        new Promise(resolve => {
+          resolveCompute = resolve;
+        })
+    );
+
+    const first = responseCache.wrap('analytics:user1:test:{}', 60, compute);
+    const second = responseCache.wrap('analytics:user1:test:{}', 60, compute);
+    await new Promise(setImmediate);
+    resolveCompute({ value: 7 });
+
+    expect(await first).toEqual({ value: 7 });
+    expect(await second).toEqual({ value: 7 });
+    expect(compute).toHaveBeenCalledTimes(1);
+    expect(responseCache.inFlight.size).toBe(0);
+  });
+
+  it('should expire entries after their TTL', async () => {
+    await responseCache.set('analytics:user1:test:{}', { value: 1 }, 0);
+    expect(await responseCache.get('analytics:user1:test:{}')).toBeNull();
+  });
+
+  it('should start every namespace at generation 0', async () => {
+    expect(await responseCache.getGeneration('analytics:gen:user1')).toBe(0);
+  });
+
+  it("should only bump the invalidated namespace's generation", async () => {
+    await responseCache.invalidate('analytics:gen:user1');
+    await responseCache.invalidate('analytics:gen:user1');
+
+    expect(await responseCache.getGeneration('analytics:gen:user1')).toBe(2);
+    expect(await responseCache.getGeneration('analytics:gen:user2')).toBe(0);
+  });
+
+  it('should recompute under the new generation after an invalidation', async () => {
+    const compute = jest.fn().mockResolvedValue({ value: 1 });
+    const cachedFor = async userId => {
+      const generation = await responseCache.getGeneration(`analytics:gen:${userId}`);
+      return responseCache.wrap(`analytics:${userId}:${generation}:test:{}`, 60, compute);
+    };
+
+    await cachedFor('user1');
+    await cachedFor('user2');
+    await responseCache.invalidate('analytics:gen:user1');
+    await cachedFor('user1');
+    await cachedFor('user2');
+
+    expect(compute).toHaveBeenCalledTimes(3);
+  });
+
+  it('should drop expired entries when another key is stored', async () => {
+    await responseCache.set('analytics:user1:0:stale:{}', { value: 1 }, 0);
+    await responseCache.set('analytics:user1:0:fresh:{}', { value: 2 }, 60);
+
+    expect(responseCache.memory.has('analytics:user1:0:stale:{}')).toBe(false);
+    expect(responseCache.memory.size).toBe(1);
+  });
+
+  it('should evict the oldest entry once the memory cache is full', async () => {
+    for (let i = 0; i < 4097; i++) {
+      await responseCache.set(`market:price:${i}`, { value: i }, 60);
+    }
+
+    expect(responseCache.memory.size).toBe(4096);
+    expect(await responseCache.get('market:price:0')).toBeNull();
+    expect(await responseCache.get('market:price:4096')).toEqual({ value: 4096 });
+  });
+});
@@ -0,0 +1,26 @@
+const RiskAnalyticsService = require('../../../src/backend/services/riskAnalyticsService');
+
+describe('RiskAnalyticsService portfolio returns', () => {
+  let service;
+
+  beforeEach(() => {
+    service = new RiskAnalyticsService();
+  });
+
+  it('should simulate 252 daily returns per year of horizon', async () => {
+    const returns = await service.calculatePortfolioReturns({}, 2);
+
+    expect(returns).toHaveLength(504);
+  });
+
+  it('should round a fractional horizon up to whole days', async () => {
+    expect(await service.calculatePortfolioReturns({}, 0.5)).toHaveLength(126);
+    expect(await service.calculatePortfolioReturns({}, 0.01)).toHaveLength(3);
+  });
+
+  it('should calculate VaR for a fractional horizon', async () => {
+    const result = await service.calculateVaR('PORTFOLIO_001', 0.95, 0.5);
+
+    expect(Number.isFinite(result.expectedShortfall)).toBe(true);
+  });
+});
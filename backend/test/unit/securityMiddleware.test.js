@@ -0,0 +1,126 @@
+const { SecurityMiddleware } = require('../../src/middleware/security');
+
+describe('SecurityMiddleware', () => {
+  let req;
+  let res;
+  let next;
+
+  beforeEach(() => {
+    req = {
+      get: jest.fn(),
+      secure: false,
+      path: '/api/test',
+      url: '/api/test',
+    };
+    res = {
+      setHeader: jest.fn(),
+      redirect: jest.fn(),
+    };
+    next = jest.fn();
+  });
+
+  it('should emit HSTS, CSP and permissions policy built from config', () => {
+    const middleware = new SecurityMiddleware({
+      enforceHttps: true,
+      cspDirectives: { 'default-src': ["'self'"], 'upgrade-insecure-requests': [] },
+    });
+
+    middleware.setSecurityHeaders(req, res, next);
+    middleware.setSecurityHeaders(req, res, next);
+
+    expect(res.setHeader).toHaveBeenCalledWith(
+      'Strict-Transport-Security',
+      'max-age=31536000; includeSubDomains; preload'
+    );
+    expect(res.setHeader).toHaveBeenCalledWith(
+      'Content-Security-Policy',
+      "default-src 'self'; upgrade-insecure-requests"
+    );
+    expect(res.setHeader).toHaveBeenCalledWith(
+      'Permissions-Policy',
+      expect.stringContaining('camera=()')
+    );
+    expect(next).toHaveBeenCalledTimes(2);
+  });
+
+  it('should leave HSTS out when HTTPS is not enforced', () => {
+    const middleware = new SecurityMiddleware({ enforceHttps: false });
+
+    middleware.setSecurityHeaders(req, res, next);
+
+    expect(res.setHeader).not.toHaveBeenCalledWith('Strict-Transport-Security', expect.anything());
+    expect(res.setHeader).toHaveBeenCalledWith('X-Frame-Options', 'DENY');
+  });
+
+  describe('handle', () => {
+    it('should redirect plain HTTP and skip the header steps', () => {
+      const middleware = new SecurityMiddleware({ enforceHttps: true });
+      req.get.mockImplementation(name => (name === 'host' ? 'app.quantenergx.com' : undefined));
+
+      middleware.handle(req, res, next);
+
+      expect(res.redirect).toHaveBeenCalledWith(301, 'https://app.quantenergx.com/api/test');
+      expect(res.setHeader).not.toHaveBeenCalled();
+      expect(next).not.toHaveBeenCalled();
+    });
+
+    it('should set the precomputed security headers on a secure request', () => {
+      const middleware = new SecurityMiddleware({ enforceHttps: true });
+      req.secure = true;
+
+      middleware.handle(req, res, next);
+
+      expect(res.redirect).not.toHaveBeenCalled();
+      expect(res.setHeader).toHaveBeenCalledWith(
+        'Strict-Transport-Security',
+        'max-age=31536000; includeSubDomains; preload'
+      );
+      expect(res.setHeader).toHaveBeenCalledWith(
+        'Content-Security-Policy',
+        expect.stringContaining("default-src 'self'")
+      );
+      expect(res.setHeader).toHaveBeenCalledWith('X-Frame-Options', 'DENY');
+      expect(res.setHeader).toHaveBeenCalledWith(
+        'Cache-Control',
+        expect.stringContaining('no-store')
+      );
+      expect(next).toHaveBeenCalledTimes(1);
+    });
+
+    it('should add regional headers by subdomain, header or path and call next', () => {
+      const middleware = new SecurityMiddleware({ enforceHttps: false });
+
+      req.get.mockImplementation(name => (name === 'host' ? 'bahrain.quantenergx.com' : undefined));
+      middleware.handle(req, res, next);
+      expect(res.setHeader).toHaveBeenCalledWith('X-CBB-Compliance', 'enabled');
+      expect(res.setHeader).toHaveBeenCalledWith('X-Trading-Region', 'bahrain');
+
+      req.get.mockImplementation(name => (name === 'X-Trading-Region' ? 'eu' : undefined));
+      middleware.handle(req, res, next);
+      expect(res.setHeader).toHaveBeenCalledWith('X-GDPR-Compliance', 'enabled');
+
+      req.get.mockReturnValue(undefined);
+      req.path = '/api/v1/regions/guyana/prices';
+      middleware.handle(req, res, next);
+      expect(res.setHeader).toHaveBeenCalledWith('X-Energy-Regulation', 'GUYANA-EPA-2023');
+
+      expect(next).toHaveBeenCalledTimes(3);
+    });
+
+    it('should fall back to the global region for unknown regions', () => {
+      const middleware = new SecurityMiddleware({ enforceHttps: false });
+      req.get.mockImplementation(name => (name === 'X-Trading-Region' ? 'atlantis' : undefined));
+
+      middleware.handle(req, res, next);
+
+      expect(res.setHeader).toHaveBeenCalledWith('X-Trading-Region', 'global');
+      expect(next).toHaveBeenCalledTimes(1);
+    });
+
+    it('should be the only middleware getMiddleware returns', () => {
+      const middleware = new SecurityMiddleware();
+
+      expect(middleware.getMiddleware()).toEqual([middleware.handle]);
+    });
+  });
+});
@@ -0,0 +1,46 @@
+const StreamingEngine = require('../../../src/backend/services/streamingEngine');
+
+describe('StreamingEngine latency stats', () => {
+  let engine;
+
+  beforeEach(() => {
+    engine = new StreamingEngine();
+  });
+
+  it('should average only the most recent 1000 samples after the window wraps', () => {
+    for (let i = 1; i <= 1500; i++) {
+      engine.updateLatencyStats(i);
+    }
+
+    const { latencyStats } = engine.getStatus().metrics;
+
+    // Window holds 501..1500
+    expect(latencyStats.avg).toBe(1000.5);
+    expect(latencyStats.min).toBe(1);
+    expect(latencyStats.max).toBe(1500);
+    expect(latencyStats.samples).toHaveLength(1000);
+    expect(latencyStats.samples[0]).toBe(501);
+    expect(latencyStats.samples[999]).toBe(1500);
+  });
+
+  it('should report samples as an array in oldest-first order before the window fills', () => {
+    [5, 10, 15].forEach(latency => engine.updateLatencyStats(latency));
+
+    const { latencyStats } = engine.getStatus().metrics;
+
+    expect(latencyStats.samples).toEqual([5, 10, 15]);
+    expect(latencyStats.avg).toBe(10);
+  });
+
+  it('should emit metrics with latency samples as an array', () => {
+    const listener = jest.fn();
+    engine.on('metrics', listener);
+    engine.updateLatencyStats(7);
+    engine.lastProcessedTime = 0;
+
+    engine.updateMetrics();
+
+    expect(listener).toHaveBeenCalledTimes(1);
+    expect(listener.mock.calls[0][0].latencyStats.samples).toEqual([7]);
+  });
+});
@@ -0,0 +1,50 @@
+const TradingService = require('../../../src/backend/services/tradingService');
+
+describe('TradingService.updateUnrealizedPnLBatch', () => {
+  let tradingService;
+
+  beforeEach(() => {
+    tradingService = new TradingService();
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should price each commodity once and mark every position against it', async () => {
+    const prices = { crude_oil: 82, natural_gas: 3.5 };
+    const getMarketPrice = jest
+      .spyOn(tradingService, 'getMarketPrice')
+      .mockImplementation(async commodity => prices[commodity]);
+
+    const positions = [
+      { commodity: 'crude_oil', quantity: 100, avgPrice: 80 },
+      { commodity: 'crude_oil', quantity: -50, avgPrice: 81 },
+      { commodity: 'natural_gas', quantity: 1000, avgPrice: 3 },
+    ];
+
+    await tradingService.updateUnrealizedPnLBatch(positions);
+
+    expect(getMarketPrice).toHaveBeenCalledTimes(2);
+    expect(positions.map(position => position.unrealizedPnL)).toEqual([200, -50, 500]);
+  });
+
+  it('should leave positions unchanged when their price lookup fails', async () => {
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+    jest.spyOn(tradingService, 'getMarketPrice').mockImplementation(async commodity => {
+      if (commodity === 'gasoline') throw new Error('feed down');
+      return 90;
+    });
+
+    const positions = [
+      { commodity: 'gasoline', quantity: 10, avgPrice: 2, unrealizedPnL: 1 },
+      { commodity: 'crude_oil', quantity: 10, avgPrice: 80 },
+    ];
+
+    await tradingService.updateUnrealizedPnLBatch(positions);
+
+    expect(positions[0].unrealizedPnL).toBe(1);
+    expect(positions[1].unrealizedPnL).toBe(100);
+    expect(console.warn).toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,65 @@
+const bcrypt = require('bcryptjs');
+const UserManagementService = require('../../../src/backend/services/userManagementService');
+
+const PASSWORD = 'Str0ng!Passw0rd';
+
+describe('UserManagementService authentication', () => {
+  let service;
+  let userId;
+
+  beforeEach(async () => {
+    service = new UserManagementService();
+    const created = await service.createUser({
+      username: 'testuser',
+      email: 'testuser@quantenergx.com',
+      password: PASSWORD,
+      role: 'trader',
+      firstName: 'Test',
+      lastName: 'User',
+    });
+    userId = created.id;
+  });
+
+  it('should accept a legacy bcrypt hash and upgrade it to argon2id', async () => {
+    const user = service.users.get(userId);
+    user.password = await bcrypt.hash(PASSWORD, 4);
+
+    const result = await service.authenticateUser('testuser', PASSWORD);
+
+    expect(result.user.id).toBe(userId);
+    expect(user.password).toMatch(/^\$argon2id\$/);
+    expect(await service.verifyPassword(user, PASSWORD)).toBe(true);
+  });
+
+  it('should leave a legacy bcrypt hash in place when the password is wrong', async () => {
+    const user = service.users.get(userId);
+    const legacyHash = await bcrypt.hash(PASSWORD, 4);
+    user.password = legacyHash;
+
+    await expect(service.authenticateUser('testuser', 'Wr0ng!Password')).rejects.toThrow(
+      'Invalid credentials'
+    );
+    expect(user.password).toBe(legacyHash);
+  });
+
+  it('should find a renamed user by the new username and email only', async () => {
+    await service.updateUser(userId, { username: 'renamed', email: 'renamed@quantenergx.com' });
+
+    expect(service.findUserByLogin('renamed').id).toBe(userId);
+    expect(service.findUserByLogin('renamed@quantenergx.com').id).toBe(userId);
+    expect(service.findUserByLogin('testuser')).toBeNull();
+    expect(service.findUserByLogin('testuser@quantenergx.com')).toBeNull();
+
+    const result = await service.authenticateUser('renamed', PASSWORD);
+    expect(result.user.id).toBe(userId);
+  });
+
+  it('should reject a token whose session has expired', async () => {
+    const { token, sessionId } = await service.authenticateUser('testuser', PASSWORD);
+    expect(service.validateToken(token).id).toBe(userId);
+
+    service.sessions.get(sessionId).expiresAtMs = Date.now() - 1;
+
+    expect(() => service.validateToken(token)).toThrow('Session expired');
+  });
+});
@@ -0,0 +1,53 @@
+const UserManagementService = require('../../../src/backend/services/userManagementService');
+
+describe('UserManagementService permission masks', () => {
+  let service;
+
+  beforeEach(() => {
+    service = new UserManagementService();
+  });
+
+  it('should grant admin every permission through the wildcard', () => {
+    const admin = { role: 'admin' };
+
+    expect(service.hasPermission(admin, '*')).toBe(true);
+    expect(service.hasPermission(admin, 'trading.place_orders')).toBe(true);
+    expect(service.hasPermission(admin, 'permission.no_role_lists')).toBe(true);
+  });
+
+  it('should only grant non-admin roles the permissions they list', () => {
+    const trader = { role: 'trader' };
+    const viewer = { role: 'viewer' };
+
+    expect(service.hasPermission(trader, 'trading.place_orders')).toBe(true);
+    expect(service.hasPermission(trader, 'compliance.manage_kyc')).toBe(false);
+    expect(service.hasPermission(trader, '*')).toBe(false);
+    expect(service.hasPermission(viewer, 'market.view_data')).toBe(true);
+    expect(service.hasPermission(viewer, 'trading.place_orders')).toBe(false);
+    expect(service.hasPermission(viewer, '*')).toBe(false);
+  });
+
+  it('should grant nothing to an unknown role', () => {
+    const user = { role: 'contractor' };
+
+    expect(service.hasPermission(user, 'market.view_data')).toBe(false);
+    expect(service.hasPermission(user, '*')).toBe(false);
+  });
+
+  it('should accept up to 31 distinct permissions', () => {
+    const permissions = Array.from({ length: 31 }, (_, i) => `custom.permission_${i}`);
+    service.roles = { custom: { name: 'Custom', permissions, description: 'Test role' } };
+
+    service.buildPermissionMasks();
+
+    expect(service.hasPermission({ role: 'custom' }, 'custom.permission_30')).toBe(true);
+    expect(service.hasPermission({ role: 'custom' }, '*')).toBe(false);
+  });
+
+  it('should refuse more distinct permissions than the mask can hold', () => {
+    const permissions = Array.from({ length: 32 }, (_, i) => `custom.permission_${i}`);
+    service.roles = { custom: { name: 'Custom', permissions, description: 'Test role' } };
+
+    expect(() => service.buildPermissionMasks()).toThrow(/Too many distinct permissions/);
+  });
+});
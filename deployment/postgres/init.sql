@@ -4,7 +4,7 @@ CREATE TABLE IF NOT EXISTS users (
     username VARCHAR(255) UNIQUE NOT NULL,
     hashed_password VARCHAR(255) NOT NULL,
     role VARCHAR(50) NOT NULL DEFAULT 'trader',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 CREATE TABLE IF NOT EXISTS trades (
@@ -14,7 +14,7 @@ CREATE TABLE IF NOT EXISTS trades (
     price NUMERIC NOT NULL,
     market VARCHAR(100) NOT NULL,
     user_id INTEGER REFERENCES users(id),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 CREATE TABLE IF NOT EXISTS compliance_logs (
@@ -22,5 +22,5 @@ CREATE TABLE IF NOT EXISTS compliance_logs (
     trade_id INTEGER REFERENCES trades(id),
     compliant BOOLEAN NOT NULL,
     error TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
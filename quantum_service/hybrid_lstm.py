@@ -212,13 +212,20 @@ class QuantumLSTMForecaster:
         else:
             scaled_features = self.scaler.transform(features)
             
-        # Create sequences
-        X, y = [], []
-        for i in range(len(scaled_features) - self.sequence_length):
-            X.append(scaled_features[i:i + self.sequence_length])
-            y.append(scaled_features[i + self.sequence_length, 0])  # Predict price
-            
-        return torch.FloatTensor(X), torch.FloatTensor(y)
+        # Create sequences as strided windows instead of copying row by row
+        scaled_features = np.asarray(scaled_features, dtype=np.float32)
+        n_samples = len(scaled_features) - self.sequence_length
+        if n_samples <= 0:
+            return (torch.empty(0, self.sequence_length, scaled_features.shape[1]),
+                    torch.empty(0))
+
+        windows = np.lib.stride_tricks.sliding_window_view(
+            scaled_features, self.sequence_length, axis=0
+        )[:n_samples]
+        X = np.ascontiguousarray(windows.transpose(0, 2, 1))
+        y = np.ascontiguousarray(scaled_features[self.sequence_length:, 0])  # Predict price
+
+        return torch.from_numpy(X), torch.from_numpy(y)
     
     def train(self, training_data: pd.DataFrame, epochs: int = 50) -> Dict[str, Any]:
         """Train the hybrid quantum-classical model"""
@@ -24,14 +24,17 @@ class RiskAnalyticsService {
       throw new Error('Portfolio not found');
     }
 
-    const returns = await this.calculatePortfolioReturns(portfolio, timeHorizon);
-    const sortedReturns = returns.sort((a, b) => a - b);
+    // Typed-array sort is numeric and native, with no per-comparison callback
+    const sortedReturns = (await this.calculatePortfolioReturns(portfolio, timeHorizon)).sort();
 
     const varIndex = Math.floor((1 - confidence) * sortedReturns.length);
     const var95 = sortedReturns[varIndex];
 
-    const expectedShortfall =
-      sortedReturns.slice(0, varIndex + 1).reduce((sum, ret) => sum + ret, 0) / (varIndex + 1);
+    let tailSum = 0;
+    for (let i = 0; i <= varIndex; i++) {
+      tailSum += sortedReturns[i];
+    }
+    const expectedShortfall = tailSum / (varIndex + 1);
 
     return {
       portfolioId,
@@ -99,12 +102,9 @@ class RiskAnalyticsService {
    */
   async runScenarioModeling(portfolioId, scenarios) {
     const portfolio = await this.getPortfolio(portfolioId);
-    const results = [];
-
-    for (const scenario of scenarios) {
-      const scenarioResult = await this.calculateScenarioImpact(portfolio, scenario);
-      results.push(scenarioResult);
-    }
+    const results = await Promise.all(
+      scenarios.map(scenario => this.calculateScenarioImpact(portfolio, scenario))
+    );
 
     return {
       portfolioId,
@@ -158,10 +158,15 @@ class RiskAnalyticsService {
    */
   async analyzeWeatherLinkedExposures(portfolioId, weatherForecast) {
     const portfolio = await this.getPortfolio(portfolioId);
+    const positions = Array.from(portfolio.positions);
+    const sensitivities = await Promise.all(
+      positions.map(([, position]) => this.getWeatherSensitivity(position))
+    );
     const weatherSensitivePositions = [];
 
-    for (const [assetId, position] of portfolio.positions) {
-      const weatherSensitivity = await this.getWeatherSensitivity(position);
+    for (let i = 0; i < positions.length; i++) {
+      const [assetId, position] = positions[i];
+      const weatherSensitivity = sensitivities[i];
 
       if (weatherSensitivity.isWeatherSensitive) {
         const weatherImpact = this.calculateWeatherImpact(
@@ -220,14 +225,25 @@ class RiskAnalyticsService {
    * Generate real-time risk dashboard data
    */
   async generateRiskDashboard(portfolioId) {
-    const [varAnalysis, stressTestResults, commodityRisk, weatherRisk, cyberRisk] =
-      await Promise.all([
-        this.calculateVaR(portfolioId),
-        this.performStressTest(portfolioId, 'market_crash'),
-        this.analyzeMultiCommodityRisk(portfolioId),
-        this.analyzeWeatherLinkedExposures(portfolioId, await this.getWeatherForecast()),
-        this.calculateCyberRiskExposure(portfolioId),
-      ]);
+    const [
+      varAnalysis,
+      stressTestResults,
+      commodityRisk,
+      weatherRisk,
+      cyberRisk,
+      alerts,
+      recommendations,
+    ] = await Promise.all([
+      this.calculateVaR(portfolioId),
+      this.performStressTest(portfolioId, 'market_crash'),
+      this.analyzeMultiCommodityRisk(portfolioId),
+      this.getWeatherForecast().then(forecast =>
+        this.analyzeWeatherLinkedExposures(portfolioId, forecast)
+      ),
+      this.calculateCyberRiskExposure(portfolioId),
+      this.generateRiskAlerts(portfolioId),
+      this.generateRiskRecommendations(portfolioId),
+    ]);
 
     return {
       portfolioId,
@@ -246,8 +262,8 @@ class RiskAnalyticsService {
         weatherRisk,
         cyberRisk,
       ]),
-      alerts: await this.generateRiskAlerts(portfolioId),
-      recommendations: await this.generateRiskRecommendations(portfolioId),
+      alerts,
+      recommendations,
     };
   }
 
@@ -295,10 +311,10 @@ class RiskAnalyticsService {
 
   async calculatePortfolioReturns(portfolio, timeHorizon) {
     // Simulated historical returns for VaR calculation
-    const returns = [];
-    for (let i = 0; i < 252 * timeHorizon; i++) {
-      const randomReturn = (Math.random() - 0.5) * 0.04; // ±2% daily volatility
-      returns.push(randomReturn);
+    // Round up like the loop bound did, so fractional horizons (e.g. 0.5 years) stay valid
+    const returns = new Float64Array(Math.max(0, Math.ceil(252 * timeHorizon)));
+    for (let i = 0; i < returns.length; i++) {
+      returns[i] = (Math.random() - 0.5) * 0.04; // ±2% daily volatility
     }
     return returns;
   }
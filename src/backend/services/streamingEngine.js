@@ -1,6 +1,9 @@
 const EventEmitter = require('events');
 // const WebSocket = require('ws'); // Currently unused but kept for future implementations
 
+// Number of recent order latencies averaged into latencyStats.avg
+const LATENCY_WINDOW = 1000;
+
 /**
  * Millisecond-level streaming and trading engine
  * Handles tick-level market data and order execution
@@ -21,10 +24,16 @@ class StreamingEngine extends EventEmitter {
         min: Infinity,
         max: 0,
         avg: 0,
-        samples: [],
       },
     };
 
+    // Rolling window of the last LATENCY_WINDOW latencies, kept in a typed ring
+    // buffer with a running sum so each update is O(1)
+    this.latencyWindow = new Float64Array(LATENCY_WINDOW);
+    this.latencyWindowNext = 0;
+    this.latencyWindowCount = 0;
+    this.latencyWindowSum = 0;
+
     this.isRunning = false;
   }
 
@@ -186,16 +195,16 @@ class StreamingEngine extends EventEmitter {
    */
   broadcastTick(tick) {
     const subscription = `${tick.symbol}:level1`;
+    // Serialize once, and only if some client is actually subscribed
+    let message = null;
 
     this.clients.forEach((client, clientId) => {
       if (client.subscriptions.has(subscription) && client.connected) {
         try {
-          client.ws.send(
-            JSON.stringify({
-              type: 'tick',
-              data: tick,
-            })
-          );
+          if (message === null) {
+            message = JSON.stringify({ type: 'tick', data: tick });
+          }
+          client.ws.send(message);
         } catch (error) {
           console.error(`Failed to send tick to client ${clientId}:`, error);
           client.connected = false;
@@ -247,15 +256,16 @@ class StreamingEngine extends EventEmitter {
    * Broadcast order update to clients
    */
   broadcastOrderUpdate(order) {
+    // Every connected client receives the same payload, so serialize it once
+    let message = null;
+
     this.clients.forEach((client, clientId) => {
       if (client.connected) {
         try {
-          client.ws.send(
-            JSON.stringify({
-              type: 'orderUpdate',
-              data: order,
-            })
-          );
+          if (message === null) {
+            message = JSON.stringify({ type: 'orderUpdate', data: order });
+          }
+          client.ws.send(message);
         } catch (error) {
           console.error(`Failed to send order update to client ${clientId}:`, error);
           client.connected = false;
@@ -271,15 +281,41 @@ class StreamingEngine extends EventEmitter {
     const stats = this.metrics.latencyStats;
     stats.min = Math.min(stats.min, latency);
     stats.max = Math.max(stats.max, latency);
-    stats.samples.push(latency);
 
-    // Keep only last 1000 samples
-    if (stats.samples.length > 1000) {
-      stats.samples.shift();
+    // Replace the oldest sample once the window is full
+    if (this.latencyWindowCount === LATENCY_WINDOW) {
+      this.latencyWindowSum -= this.latencyWindow[this.latencyWindowNext];
+    } else {
+      this.latencyWindowCount++;
     }
+    this.latencyWindow[this.latencyWindowNext] = latency;
+    this.latencyWindowSum += latency;
+    this.latencyWindowNext = (this.latencyWindowNext + 1) % LATENCY_WINDOW;
 
-    // Calculate average
-    stats.avg = stats.samples.reduce((sum, val) => sum + val, 0) / stats.samples.length;
+    stats.avg = this.latencyWindowSum / this.latencyWindowCount;
+  }
+
+  /**
+   * Latency samples in the window, oldest first
+   */
+  getLatencySamples() {
+    const count = this.latencyWindowCount;
+    const start = count === LATENCY_WINDOW ? this.latencyWindowNext : 0;
+    const samples = new Array(count);
+    for (let i = 0; i < count; i++) {
+      samples[i] = this.latencyWindow[(start + i) % LATENCY_WINDOW];
+    }
+    return samples;
+  }
+
+  /**
+   * Metrics snapshot with latency samples as a plain array
+   */
+  getMetricsSnapshot() {
+    return {
+      ...this.metrics,
+      latencyStats: { ...this.metrics.latencyStats, samples: this.getLatencySamples() },
+    };
   }
 
   /**
@@ -292,7 +328,7 @@ class StreamingEngine extends EventEmitter {
     if (elapsed >= 1000) {
       // Update every second
       this.emit('metrics', {
-        ...this.metrics,
+        ...this.getMetricsSnapshot(),
         queueSizes: {
           ticks: this.tickQueue.length,
           orders: this.orderQueue.length,
@@ -325,7 +361,7 @@ class StreamingEngine extends EventEmitter {
   getStatus() {
     return {
       isRunning: this.isRunning,
-      metrics: this.metrics,
+      metrics: this.getMetricsSnapshot(),
       queueSizes: {
         ticks: this.tickQueue.length,
         orders: this.orderQueue.length,
@@ -372,6 +372,30 @@ class TradingService extends EventEmitter {
     }
   }
 
+  // Calculate unrealized P&L for many positions, pricing each commodity once
+  async updateUnrealizedPnLBatch(positions) {
+    const commodities = [...new Set(positions.map(position => position.commodity))];
+    const prices = await Promise.allSettled(
+      commodities.map(commodity => this.getMarketPrice(commodity))
+    );
+
+    const priceByCommodity = new Map();
+    prices.forEach((result, index) => {
+      if (result.status === 'fulfilled') {
+        priceByCommodity.set(commodities[index], result.value);
+      } else {
+        console.warn('Failed to update unrealized P&L:', result.reason?.message);
+      }
+    });
+
+    for (const position of positions) {
+      const currentPrice = priceByCommodity.get(position.commodity);
+      if (currentPrice !== undefined) {
+        position.unrealizedPnL = position.quantity * (currentPrice - position.avgPrice);
+      }
+    }
+  }
+
   // Add order to order book
   addToOrderBook(order) {
     const orderBook = this.orderBook.get(order.commodity);
@@ -580,9 +604,7 @@ class TradingService extends EventEmitter {
     const trades = this.getTradeHistory(userId);
 
     // Update unrealized P&L for all positions
-    for (const position of positions) {
-      await this.updateUnrealizedPnL(position);
-    }
+    await this.updateUnrealizedPnLBatch(positions);
 
     const totalValue = positions.reduce(
       (sum, pos) => sum + Math.abs(pos.quantity * pos.avgPrice),
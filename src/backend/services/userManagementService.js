@@ -1,13 +1,21 @@
+const argon2 = require('argon2');
 const bcrypt = require('bcryptjs');
 const jwt = require('jsonwebtoken');
-const { v4: uuidv4 } = require('uuid');
 const crypto = require('crypto');
 const validationUtils = require('../utils/validationUtils');
 
+const JWT_SIGN_OPTIONS = Object.freeze({ algorithm: 'HS256', expiresIn: '24h' });
+const JWT_VERIFY_OPTIONS = Object.freeze({ algorithms: ['HS256'] });
+// JS bitwise operators work on 32-bit ints; the sign bit is left out of permission bits
+const MAX_PERMISSION_BITS = 31;
+const ALL_PERMISSIONS_MASK = ~0;
+
 class UserManagementService {
   constructor() {
     // In-memory storage for demo (would use database in production)
     this.users = new Map();
+    this.usersByUsername = new Map();
+    this.usersByEmail = new Map();
     this.sessions = new Map();
     this.mfaTokens = new Map();
     this.auditLogs = new Map();
@@ -21,8 +29,18 @@ class UserManagementService {
       sessionTimeout: 24 * 60 * 60 * 1000, // 24 hours
       mfaTokenExpiry: 5 * 60 * 1000, // 5 minutes
       jwtSecret: process.env.JWT_SECRET || 'fallback-secret-key',
+      // argon2id runs natively off the event loop, unlike pure-JS bcryptjs
+      passwordHashOptions: {
+        type: argon2.argon2id,
+        memoryCost: parseInt(process.env.ARGON2_MEMORY_COST) || 2 ** 16, // KiB, 64 MB default
+        timeCost: parseInt(process.env.ARGON2_TIME_COST) || 2,
+        parallelism: parseInt(process.env.ARGON2_PARALLELISM) || 1,
+      },
     };
 
+    // Signing key object built once and reused for every sign/verify
+    this.jwtKey = crypto.createSecretKey(Buffer.from(this.config.jwtSecret, 'utf8'));
+
     // Role definitions
     this.roles = {
       admin: {
@@ -88,10 +106,37 @@ class UserManagementService {
       },
     };
 
+    this.buildPermissionMasks();
+
     // Initialize demo users
     this.initializeDemoUsers();
   }
 
+  // Each distinct permission gets one bit and each role a mask, so a check is a single AND
+  buildPermissionMasks() {
+    this.permissionBits = new Map();
+    this.roleMasks = new Map();
+    for (const [role, { permissions }] of Object.entries(this.roles)) {
+      let mask = 0;
+      for (const permission of permissions) {
+        if (permission === '*') {
+          mask = ALL_PERMISSIONS_MASK;
+          break;
+        }
+        let bit = this.permissionBits.get(permission);
+        if (bit === undefined) {
+          if (this.permissionBits.size >= MAX_PERMISSION_BITS) {
+            throw new Error(`Too many distinct permissions for a ${MAX_PERMISSION_BITS}-bit mask`);
+          }
+          bit = 1 << this.permissionBits.size;
+          this.permissionBits.set(permission, bit);
+        }
+        mask |= bit;
+      }
+      this.roleMasks.set(role, mask);
+    }
+  }
+
   async initializeDemoUsers() {
     // Create demo users for testing
     const demoUsers = [
@@ -137,20 +182,16 @@ class UserManagementService {
       this.validateUserData(userData);
 
       // Check if user already exists
-      const existingUser = Array.from(this.users.values()).find(
-        user => user.username === userData.username || user.email === userData.email
-      );
-
-      if (existingUser) {
+      if (this.usersByUsername.has(userData.username) || this.usersByEmail.has(userData.email)) {
         throw new Error('Username or email already exists');
       }
 
       // Hash password
-      const hashedPassword = await bcrypt.hash(userData.password, 12);
+      const hashedPassword = await argon2.hash(userData.password, this.config.passwordHashOptions);
 
       // Create user object
       const user = {
-        id: uuidv4(),
+        id: crypto.randomUUID(),
         username: userData.username,
         email: userData.email,
         password: hashedPassword,
@@ -169,6 +210,8 @@ class UserManagementService {
 
       // Store user
       this.users.set(user.id, user);
+      this.usersByUsername.set(user.username, user);
+      this.usersByEmail.set(user.email, user);
 
       // Log audit event
       await this.logAuditEvent({
@@ -188,9 +231,7 @@ class UserManagementService {
   // Authenticate user
   async authenticateUser(username, password, mfaToken = null) {
     // Find user
-    const user = Array.from(this.users.values()).find(
-      u => u.username === username || u.email === username
-    );
+    const user = this.findUserByLogin(username);
 
     if (!user) {
       await this.logAuditEvent({
@@ -221,7 +262,7 @@ class UserManagementService {
     }
 
     // Verify password
-    const passwordValid = await bcrypt.compare(password, user.password);
+    const passwordValid = await this.verifyPassword(user, password);
     if (!passwordValid) {
       // Increment login attempts
       user.loginAttempts++;
@@ -277,12 +318,14 @@ class UserManagementService {
     }
 
     // Reset login attempts on successful login
+    const now = Date.now();
+    const loginTime = new Date(now).toISOString();
     user.loginAttempts = 0;
     user.lockedUntil = null;
-    user.lastLogin = new Date().toISOString();
+    user.lastLogin = loginTime;
 
     // Generate JWT token
-    const sessionId = uuidv4();
+    const sessionId = crypto.randomUUID();
     const token = jwt.sign(
       {
         id: user.id,
@@ -290,15 +333,16 @@ class UserManagementService {
         role: user.role,
         sessionId,
       },
-      this.config.jwtSecret,
-      { expiresIn: '24h' }
+      this.jwtKey,
+      JWT_SIGN_OPTIONS
     );
 
     // Store session
     this.sessions.set(sessionId, {
       userId: user.id,
-      createdAt: new Date().toISOString(),
-      expiresAt: new Date(Date.now() + this.config.sessionTimeout).toISOString(),
+      createdAt: loginTime,
+      expiresAt: new Date(now + this.config.sessionTimeout).toISOString(),
+      expiresAtMs: now + this.config.sessionTimeout,
       ipAddress: null, // Would be set by route handler
       userAgent: null, // Would be set by route handler
     });
@@ -339,31 +383,36 @@ class UserManagementService {
 
   // Validate JWT token
   validateToken(token) {
+    let decoded;
     try {
-      const decoded = jwt.verify(token, this.config.jwtSecret);
-
-      // Check if session still exists
-      const session = this.sessions.get(decoded.sessionId);
-      if (!session || new Date() > new Date(session.expiresAt)) {
-        throw new Error('Session expired');
-      }
-
-      return decoded;
+      decoded = jwt.verify(token, this.jwtKey, JWT_VERIFY_OPTIONS);
     } catch (_error) {
       throw new Error('Invalid token');
     }
+
+    // Check if session still exists
+    const session = this.sessions.get(decoded.sessionId);
+    if (!session || Date.now() > session.expiresAtMs) {
+      throw new Error('Session expired');
+    }
+
+    return decoded;
   }
 
   // Check user permissions
   hasPermission(user, permission) {
-    const userRole = this.roles[user.role];
-    if (!userRole) return false;
+    const mask = this.roleMasks.get(user.role) ?? 0;
 
-    // Admin has all permissions
-    if (userRole.permissions.includes('*')) return true;
+    // Admin has all permissions, including ones no other role lists
+    if (mask === ALL_PERMISSIONS_MASK) return true;
 
     // Check specific permission
-    return userRole.permissions.includes(permission);
+    return (mask & (this.permissionBits.get(permission) ?? 0)) !== 0;
+  }
+
+  // Look up a user by username or email
+  findUserByLogin(login) {
+    return this.usersByUsername.get(login) || this.usersByEmail.get(login) || null;
   }
 
   // Get user by ID
@@ -386,14 +435,18 @@ class UserManagementService {
       // Validate updates
       if (updates.password) {
         this.validatePassword(updates.password);
-        updates.password = await bcrypt.hash(updates.password, 12);
+        updates.password = await argon2.hash(updates.password, this.config.passwordHashOptions);
+      }
+
+      if (updates.username && updates.username !== user.username) {
+        if (this.usersByUsername.has(updates.username)) {
+          throw new Error('Username already exists');
+        }
       }
 
       if (updates.email && updates.email !== user.email) {
-        const existingUser = Array.from(this.users.values()).find(
-          u => u.email === updates.email && u.id !== userId
-        );
-        if (existingUser) {
+        const existingUser = this.usersByEmail.get(updates.email);
+        if (existingUser && existingUser.id !== userId) {
           throw new Error('Email already exists');
         }
       }
@@ -403,10 +456,21 @@ class UserManagementService {
       }
 
       // Apply updates
+      const previousUsername = user.username;
+      const previousEmail = user.email;
       Object.assign(user, updates, {
         updatedAt: new Date().toISOString(),
       });
 
+      if (user.username !== previousUsername) {
+        this.usersByUsername.delete(previousUsername);
+        this.usersByUsername.set(user.username, user);
+      }
+      if (user.email !== previousEmail) {
+        this.usersByEmail.delete(previousEmail);
+        this.usersByEmail.set(user.email, user);
+      }
+
       await this.logAuditEvent({
         userId,
         action: 'user_updated',
@@ -513,7 +577,7 @@ class UserManagementService {
   // Log audit event
   async logAuditEvent(event) {
     const auditLog = {
-      id: uuidv4(),
+      id: crypto.randomUUID(),
       userId: event.userId || null,
       action: event.action,
       details: event.details || {},
@@ -547,6 +611,20 @@ class UserManagementService {
     }
   }
 
+  // Verify a password, re-hashing legacy bcrypt or stale argon2 parameters on success
+  async verifyPassword(user, password) {
+    const options = this.config.passwordHashOptions;
+    const isArgon2 = user.password.startsWith('$argon2');
+    const valid = isArgon2
+      ? await argon2.verify(user.password, password)
+      : await bcrypt.compare(password, user.password);
+
+    if (valid && (!isArgon2 || argon2.needsRehash(user.password, options))) {
+      user.password = await argon2.hash(password, options);
+    }
+    return valid;
+  }
+
   // Validate password
   validatePassword(password) {
     if (password.length < this.config.passwordMinLength) {
@@ -582,7 +660,7 @@ class UserManagementService {
   getUserSessions(userId) {
     return Array.from(this.sessions.entries())
       .filter(([_, session]) => session.userId === userId)
-      .map(([sessionId, session]) => ({
+      .map(([sessionId, { expiresAtMs: _expiresAtMs, ...session }]) => ({
         sessionId,
         ...session,
       }));
@@ -607,9 +685,9 @@ class UserManagementService {
 
   // Clean up expired sessions
   cleanupExpiredSessions() {
-    const now = new Date();
+    const now = Date.now();
     for (const [sessionId, session] of this.sessions.entries()) {
-      if (now > new Date(session.expiresAt)) {
+      if (now > session.expiresAtMs) {
         this.sessions.delete(sessionId);
       }
     }
@@ -0,0 +1,54 @@
+const validator = require('validator');
+
+/**
+ * Input validation utilities for the src/backend services
+ * Mirrors the email rules in backend/src/utils/validationUtils.js
+ */
+class ValidationUtils {
+  constructor() {
+    // Known disposable email domains (basic list)
+    this.disposableDomains = new Set([
+      '10minutemail.com',
+      'temp-mail.org',
+      'guerrillamail.com',
+      'mailinator.com',
+      'yopmail.com',
+      'throwaway.email',
+    ]);
+  }
+
+  /**
+   * Validate email with additional checks
+   * @param {string} email - Email to validate
+   * @returns {Object} - Validation result
+   */
+  validateEmail(email) {
+    const result = { valid: false, issues: [] };
+
+    if (!email) {
+      result.issues.push('Email is required');
+      return result;
+    }
+
+    if (!validator.isEmail(email)) {
+      result.issues.push('Invalid email format');
+      return result;
+    }
+
+    if (email.length > 254) {
+      result.issues.push('Email is too long');
+      return result;
+    }
+
+    const domain = email.split('@')[1]?.toLowerCase();
+    if (this.disposableDomains.has(domain)) {
+      result.issues.push('Disposable email addresses are not allowed');
+      return result;
+    }
+
+    result.valid = true;
+    return result;
+  }
+}
+
+module.exports = new ValidationUtils();